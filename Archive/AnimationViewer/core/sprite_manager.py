@@ -17,6 +17,7 @@ class SpriteSheetManager:
         self.sprite_sheets: Dict[str, SpriteSheet] = {}
         self.active_sheet_id: Optional[str] = None
         self.sheet_counter = 0  # For generating unique IDs
+        self._sheets_version = 0  # Bumped whenever the sheet set or active sheet changes
     
     def load_sprite_sheet(self, filepath: str, tile_size: Tuple[int, int], 
                          margin: int = 0, spacing: int = 0, 
@@ -48,6 +49,7 @@ class SpriteSheetManager:
             if self.active_sheet_id is None:
                 self.active_sheet_id = sheet_id
             
+            self._sheets_version += 1
             return sheet_id
             
         except SpriteSheetValidationError as e:
@@ -84,6 +86,7 @@ class SpriteSheetManager:
             remaining_ids = list(self.sprite_sheets.keys())
             self.active_sheet_id = remaining_ids[0] if remaining_ids else None
         
+        self._sheets_version += 1
         return True
     
     def set_active_sheet(self, sheet_id: str) -> bool:
@@ -97,7 +100,9 @@ class SpriteSheetManager:
             True if successful
         """
         if sheet_id in self.sprite_sheets:
-            self.active_sheet_id = sheet_id
+            if self.active_sheet_id != sheet_id:
+                self.active_sheet_id = sheet_id
+                self._sheets_version += 1
             return True
         return False
     
@@ -163,6 +168,7 @@ class SpriteSheetManager:
         self.sprite_sheets.clear()
         self.active_sheet_id = None
         self.sheet_counter = 0
+        self._sheets_version += 1
     
     def suggest_tile_size(self, filepath: str) -> Optional[Tuple[int, int]]:
         """
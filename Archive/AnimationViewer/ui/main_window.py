@@ -51,7 +51,11 @@ class SpriteAnimationTool:
         self.clock = pygame.time.Clock()
         self.project = AnimationProject()
         self.file_manager = FileManager()
+        self._sheet_dialog = None  # Future of the open sprite sheet dialog
         self.file_ops = EnhancedFileOperations()
+        # Only prewarm once file_ops has built the main thread's Tk root, so
+        # that root stays tkinter's default and the dialog thread gets its own
+        self.file_manager.prewarm()
 
         # Initialize preferences
         self.preferences = PreferencesManager()
@@ -519,9 +523,10 @@ class SpriteAnimationTool:
             print(f"Error loading animation frames: {e}")
             self.status_bar.show_info(f"Failed to load animation: {animation_entry.name}")
     
-    def _handle_tab_manager_action(self, action: str):
+    def _handle_tab_manager_action(self, action: Tuple[str, int]):
         """Handle actions from the tab manager."""
-        if action.startswith("switch_tab:"):
+        verb = action[0]
+        if verb == "switch_tab":
             result = self.tab_manager.process_action(action)
             if result:
                 # Update active spritesheet based on tab
@@ -531,7 +536,7 @@ class SpriteAnimationTool:
                     self._update_sprite_info_panel()
                     self.status_bar.show_info(f"Switched to: {active_tab.name}")
         
-        elif action.startswith("close_tab:"):
+        elif verb == "close_tab":
             result = self.tab_manager.process_action(action)
             if result:
                 # Update active spritesheet based on remaining tabs
@@ -929,11 +934,18 @@ class SpriteAnimationTool:
     def _menu_open_sprite_sheet(self):
         """Open a sprite sheet file dialog with enhanced file operations."""
         self.status_bar.set_operation_status("Opening", "Selecting sprite sheet...")
-        
-        file_paths = self.file_ops.open_sprite_sheet_dialog(multiple=False)
+        # The dialog runs off the main loop; _poll_sheet_dialog() finishes the open
+        self._open_sprite_sheet()
+    
+    def _finish_open_sprite_sheet(self, file_paths: Optional[List[str]]):
+        """Validate and load the sprite sheet chosen in the open dialog."""
         if file_paths:
             file_path = file_paths[0]
             
+            # Remember the folder like file_ops' own dialog does
+            self.file_ops.last_sprite_dir = os.path.dirname(file_path)
+            self.preferences.set("file_management", "last_sprite_dir", self.file_ops.last_sprite_dir)
+            
             # Validate the file before loading
             is_valid, message = self.file_ops.validate_sprite_sheet(file_path)
             if not is_valid:
@@ -1558,6 +1570,9 @@ class SpriteAnimationTool:
     def _menu_exit(self):
         """Exit the application."""
         self._save_window_state()
+        self.preferences.flush()
+        # The dialog thread owns the Tk root and must destroy it before exit
+        self.file_manager.cleanup()
         pygame.quit()
         sys.exit()
     
@@ -2021,7 +2036,7 @@ class SpriteAnimationTool:
                     self.tab_manager.handle_mouse_motion(event.pos)
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     tab_action = self.tab_manager.handle_click(event.pos)
-                    if tab_action != "none":
+                    if tab_action[0] != "none":
                         self._handle_tab_manager_action(tab_action)
                         return
         else:
@@ -2301,95 +2316,6 @@ class SpriteAnimationTool:
         elif event.type == pygame.TEXTINPUT:
             self.current_text += event.text
     
-    def _open_sprite_sheet(self):
-        """Open sprite sheet dialog."""
-        try:
-            filepaths = self.file_manager.open_sprite_sheet_dialog()
-            if filepaths:
-                # For now, load the first selected file
-                filepath = filepaths[0]
-                
-                # TODO: Add proper tile size detection dialog
-                # For now, use suggested tile size or default
-                suggested_size = self.project.sprite_manager.suggest_tile_size(filepath)
-                tile_size = suggested_size or (32, 32)
-                
-                sheet_id = self.project.sprite_manager.load_sprite_sheet(
-                    filepath, tile_size, margin=0, spacing=0
-                )
-                
-                if sheet_id:
-                    self.active_sheet_id = sheet_id
-                    self.active_sheet = self.project.sprite_manager.get_sprite_sheet(sheet_id)
-                    # Provide active sheet to the info panel
-                    if self.sprite_browser_panel:
-                        self.sprite_browser_panel.set_active_spritesheet(self.active_sheet, {'name': os.path.basename(filepath)})
-                    
-                    # Get sprite sheet info for status display
-                    tile_count = self.active_sheet.get_tile_count() if self.active_sheet else 0
-                    dimensions = f"{self.active_sheet.rows}x{self.active_sheet.cols}" if self.active_sheet else "Unknown"
-                    
-                    self._update_ui_state()
-                    
-                    # Show success with detailed info
-                    self.status_bar.show_success(f"Loaded {os.path.basename(filepath)} ({dimensions} grid, {tile_count} tiles)")
-
-                    # Auto-detect sibling Aseprite JSON (always attempt)
-                    try:
-                        base, _ = os.path.splitext(filepath)
-                        primary_json = base + ".json"
-                        attempted = set()
-                        def try_load_json(json_path: str):
-                            if not os.path.exists(json_path) or json_path in attempted:
-                                return False
-                            attempted.add(json_path)
-                            from aseprite_loader import AsepriteJSONLoader
-                            loader = AsepriteJSONLoader(json_path)
-                            doc = loader.load()
-                            if doc.animations and doc.frames:
-                                # Update grid if needed
-                                if self.active_sheet and doc.frames:
-                                    self._update_sprite_sheet_from_aseprite(doc)
-                                try:
-                                    source = AsepriteAnimationSource(doc, json_path)
-                                    self._register_aseprite_source(source)
-                                    self.status_bar.show_success(f"Auto-loaded Aseprite JSON: {os.path.basename(json_path)} ({len(doc.animations)} animations)")
-                                    return True
-                                except Exception as adapt_e:
-                                    print(f"Auto adapter error: {adapt_e}")
-                            return False
-                        loaded = try_load_json(primary_json)
-                        if not loaded:
-                            # Fallback scan directory for matching meta.image
-                            sheet_filename = os.path.basename(filepath)
-                            folder = os.path.dirname(filepath)
-                            for name in os.listdir(folder):
-                                if not name.lower().endswith('.json'):
-                                    continue
-                                candidate_path = os.path.join(folder, name)
-                                if candidate_path in attempted:
-                                    continue
-                                try:
-                                    with open(candidate_path, 'r', encoding='utf-8') as jf:
-                                        jdata = json.load(jf)
-                                    meta = jdata.get('meta', {})
-                                    image_ref = meta.get('image')
-                                    if image_ref and os.path.basename(image_ref) == sheet_filename:
-                                        if try_load_json(candidate_path):
-                                            break
-                                except Exception as scan_e:
-                                    print(f"Auto-scan skip {candidate_path}: {scan_e}")
-                    except Exception as ase_e:
-                        print(f"Aseprite auto-detect error: {ase_e}")
-                else:
-                    self.status_bar.show_error(f"Failed to load sprite sheet: {os.path.basename(filepath)}")
-        else:
-                # User cancelled - no-op
-                pass
-        except Exception as e:
-            error_msg = f"Error loading sprite sheet: {str(e)}"
-            self.status_bar.show_error(error_msg)
-    
     def get_center_panel_rect(self) -> pygame.Rect:
         """Get the rectangle for the center panel (frame grid area)."""
         content_top = self.menu_height + self.toolbar_height
@@ -2528,7 +2454,7 @@ class SpriteAnimationTool:
                     self.tab_manager.handle_mouse_motion(event.pos)
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     tab_action = self.tab_manager.handle_click(event.pos)
-                    if tab_action != "none":
+                    if tab_action[0] != "none":
                         self._handle_tab_manager_action(tab_action)
                         return
         else:
@@ -2808,92 +2734,6 @@ class SpriteAnimationTool:
         elif event.type == pygame.TEXTINPUT:
             self.current_text += event.text
     
-    def _open_sprite_sheet(self):
-        """Open sprite sheet dialog."""
-        filepaths = self.file_manager.open_sprite_sheet_dialog()
-        if filepaths:
-            # For now, load the first selected file
-            filepath = filepaths[0]
-            
-            # TODO: Add proper tile size detection dialog
-            # For now, use suggested tile size or default
-            suggested_size = self.project.sprite_manager.suggest_tile_size(filepath)
-            tile_size = suggested_size or (32, 32)
-            
-            sheet_id = self.project.sprite_manager.load_sprite_sheet(
-                filepath, tile_size, margin=0, spacing=0
-            )
-            
-            if sheet_id:
-                self.active_sheet_id = sheet_id
-                self.active_sheet = self.project.sprite_manager.get_sprite_sheet(sheet_id)
-                # Provide active sheet to the info panel
-                if self.sprite_browser_panel:
-                    self.sprite_browser_panel.set_active_spritesheet(self.active_sheet, {'name': os.path.basename(filepath)})
-                
-                # Get sprite sheet info for status display
-                tile_count = self.active_sheet.get_tile_count() if self.active_sheet else 0
-                dimensions = f"{self.active_sheet.rows}x{self.active_sheet.cols}" if self.active_sheet else "Unknown"
-                
-                self._update_ui_state()
-                
-                # Show success with detailed info
-                self.status_bar.show_success(f"Loaded {filename} ({dimensions} grid, {tile_count} tiles)")
-
-                # Auto-detect sibling Aseprite JSON (always attempt)
-                try:
-                    base, _ = os.path.splitext(filepath)
-                    primary_json = base + ".json"
-                    attempted = set()
-                    def try_load_json(json_path: str):
-                        if not os.path.exists(json_path) or json_path in attempted:
-                            return False
-                        attempted.add(json_path)
-                        from aseprite_loader import AsepriteJSONLoader
-                        loader = AsepriteJSONLoader(json_path)
-                        doc = loader.load()
-                        if doc.animations and doc.frames:
-                            # Update grid if needed
-                            if self.active_sheet and doc.frames:
-                                self._update_sprite_sheet_from_aseprite(doc)
-                            try:
-                                source = AsepriteAnimationSource(doc, json_path)
-                                self._register_aseprite_source(source)
-                                self.status_bar.show_success(f"Auto-loaded Aseprite JSON: {os.path.basename(json_path)} ({len(doc.animations)} animations)")
-                                return True
-                            except Exception as adapt_e:
-                                print(f"Auto adapter error: {adapt_e}")
-                        return False
-                    loaded = try_load_json(primary_json)
-                    if not loaded:
-                        # Fallback scan directory for matching meta.image
-                        sheet_filename = os.path.basename(filepath)
-                        folder = os.path.dirname(filepath)
-                        for name in os.listdir(folder):
-                            if not name.lower().endswith('.json'):
-                                continue
-                            candidate_path = os.path.join(folder, name)
-                            if candidate_path in attempted:
-                                continue
-                            try:
-                                with open(candidate_path, 'r', encoding='utf-8') as jf:
-                                    jdata = json.load(jf)
-                                meta = jdata.get('meta', {})
-                                image_ref = meta.get('image')
-                                if image_ref and os.path.basename(image_ref) == sheet_filename:
-                                    if try_load_json(candidate_path):
-                                        break
-                            except Exception as scan_e:
-                                print(f"Auto-scan skip {candidate_path}: {scan_e}")
-                except Exception as ase_e:
-                    print(f"Aseprite auto-detect error: {ase_e}")
-        else:
-                self.status_bar.show_error(f"Failed to load sprite sheet: {filename}")
-                
-        except Exception as e:
-            error_msg = f"Error loading {os.path.basename(filepath)}: {str(e)}"
-            self.status_bar.show_error(error_msg)
-    
     def get_center_panel_rect(self) -> pygame.Rect:
         """Get the rectangle for the center panel (frame grid area)."""
         content_top = self.menu_height + self.toolbar_height
@@ -3032,7 +2872,7 @@ class SpriteAnimationTool:
                     self.tab_manager.handle_mouse_motion(event.pos)
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     tab_action = self.tab_manager.handle_click(event.pos)
-                    if tab_action != "none":
+                    if tab_action[0] != "none":
                         self._handle_tab_manager_action(tab_action)
                         return
         else:
@@ -3313,90 +3153,26 @@ class SpriteAnimationTool:
             self.current_text += event.text
     
     def _open_sprite_sheet(self):
-        """Open sprite sheet dialog."""
-        filepaths = self.file_manager.open_sprite_sheet_dialog()
-        if filepaths:
-            # For now, load the first selected file
-            filepath = filepaths[0]
-            
-            # TODO: Add proper tile size detection dialog
-            # For now, use suggested tile size or default
-            suggested_size = self.project.sprite_manager.suggest_tile_size(filepath)
-            tile_size = suggested_size or (32, 32)
-            
-            sheet_id = self.project.sprite_manager.load_sprite_sheet(
-                filepath, tile_size, margin=0, spacing=0
-            )
-            
-            if sheet_id:
-                self.active_sheet_id = sheet_id
-                self.active_sheet = self.project.sprite_manager.get_sprite_sheet(sheet_id)
-                # Provide active sheet to the info panel
-                if self.sprite_browser_panel:
-                    self.sprite_browser_panel.set_active_spritesheet(self.active_sheet, {'name': os.path.basename(filepath)})
-                
-                # Get sprite sheet info for status display
-                tile_count = self.active_sheet.get_tile_count() if self.active_sheet else 0
-                dimensions = f"{self.active_sheet.rows}x{self.active_sheet.cols}" if self.active_sheet else "Unknown"
-                
-                self._update_ui_state()
-                
-                # Show success with detailed info
-                self.status_bar.show_success(f"Loaded {filename} ({dimensions} grid, {tile_count} tiles)")
-
-                # Auto-detect sibling Aseprite JSON (always attempt)
-                try:
-                    base, _ = os.path.splitext(filepath)
-                    primary_json = base + ".json"
-                    attempted = set()
-                    def try_load_json(json_path: str):
-                        if not os.path.exists(json_path) or json_path in attempted:
-                            return False
-                        attempted.add(json_path)
-                        from aseprite_loader import AsepriteJSONLoader
-                        loader = AsepriteJSONLoader(json_path)
-                        doc = loader.load()
-                        if doc.animations and doc.frames:
-                            # Update grid if needed
-                            if self.active_sheet and doc.frames:
-                                self._update_sprite_sheet_from_aseprite(doc)
-                            try:
-                                source = AsepriteAnimationSource(doc, json_path)
-                                self._register_aseprite_source(source)
-                                self.status_bar.show_success(f"Auto-loaded Aseprite JSON: {os.path.basename(json_path)} ({len(doc.animations)} animations)")
-                                return True
-                            except Exception as adapt_e:
-                                print(f"Auto adapter error: {adapt_e}")
-                        return False
-                    loaded = try_load_json(primary_json)
-                    if not loaded:
-                        # Fallback scan directory for matching meta.image
-                        sheet_filename = os.path.basename(filepath)
-                        folder = os.path.dirname(filepath)
-                        for name in os.listdir(folder):
-                            if not name.lower().endswith('.json'):
-                                continue
-                            candidate_path = os.path.join(folder, name)
-                            if candidate_path in attempted:
-                                continue
-                            try:
-                                with open(candidate_path, 'r', encoding='utf-8') as jf:
-                                    jdata = json.load(jf)
-                                meta = jdata.get('meta', {})
-                                image_ref = meta.get('image')
-                                if image_ref and os.path.basename(image_ref) == sheet_filename:
-                                    if try_load_json(candidate_path):
-                                        break
-                            except Exception as scan_e:
-                                print(f"Auto-scan skip {candidate_path}: {scan_e}")
-                except Exception as ase_e:
-                    print(f"Aseprite auto-detect error: {ase_e}")
-        else:
-                self.status_bar.show_error(f"Failed to load sprite sheet: {filename}")
-                
+        """Start the sprite sheet open dialog; run() loads the result when it closes."""
+        if self._sheet_dialog is not None:
+            return  # Dialog already open
+        self._sheet_dialog = self.file_manager.open_sprite_sheet_dialog_async(
+            initialdir=self.file_ops.last_sprite_dir
+        )
+    
+    def _poll_sheet_dialog(self):
+        """Finish the pending sprite sheet open dialog, if it has closed."""
+        future = self._sheet_dialog
+        if future is None or not future.done():
+            return
+        self._sheet_dialog = None
+        try:
+            filepaths = future.result()
         except Exception as e:
-            error_msg = f"Error loading {os.path.basename(filepath)}: {str(e)}"
-            self.status_bar.show_error(error_msg)
+            print(f"File dialog error: {e}")
+            self.status_bar.show_error("Could not open file dialog")
+            return
+        self._finish_open_sprite_sheet(filepaths)
     
     def get_center_panel_rect(self) -> pygame.Rect:
         """Get the rectangle for the center panel (frame grid area)."""
@@ -3472,6 +3248,9 @@ class SpriteAnimationTool:
                 else:
                     self._handle_event(event)
             
+            # Finish a sprite sheet open dialog that closed since the last frame
+            self._poll_sheet_dialog()
+            
             # Update and render
             self._update()
             self._render()
@@ -3479,6 +3258,7 @@ class SpriteAnimationTool:
         
         # Cleanup
         self._save_window_state()
+        self.preferences.flush()
         self.file_manager.cleanup()
         self.file_ops.cleanup()
         pygame.quit()
@@ -3536,7 +3316,7 @@ class SpriteAnimationTool:
                     self.tab_manager.handle_mouse_motion(event.pos)
                 elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     tab_action = self.tab_manager.handle_click(event.pos)
-                    if tab_action != "none":
+                    if tab_action[0] != "none":
                         self._handle_tab_manager_action(tab_action)
                         return
         else:
@@ -3566,6 +3346,7 @@ class SpriteAnimationTool:
         elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
             if self.left_splitter_rect.collidepoint(event.pos):
                 self.drag_left_splitter = True
+                self.sprite_browser_panel.set_resizing(True)
             elif self.right_splitter_rect.collidepoint(event.pos):
                 self.drag_right_splitter = True
         elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
@@ -3573,6 +3354,8 @@ class SpriteAnimationTool:
                 # Persist new widths
                 self.preferences.set("layout", "left_panel_width", int(self.left_panel_width))
                 self.preferences.set("layout", "right_panel_width", int(self.right_panel_width))
+            if self.drag_left_splitter:
+                self.sprite_browser_panel.set_resizing(False)
             self.drag_left_splitter = False
             self.drag_right_splitter = False
         
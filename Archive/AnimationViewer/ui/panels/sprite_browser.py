@@ -7,6 +7,10 @@ from typing import List, Dict, Optional, Tuple
 from .base_panel import Panel
 
 
+# Characters accepted by the numeric grid fields
+_DIGITS = frozenset('0123456789')
+
+
 class SpriteSheetBrowserPanel(Panel):
     """
     Panel for browsing and managing sprite sheets with tabbed interface.
@@ -39,6 +43,7 @@ class SpriteSheetBrowserPanel(Panel):
         self.tabs: List[Dict] = []  # List of tab info: {id, name, rect, close_rect}
         self.active_tab_id: Optional[str] = None
         self.tab_scroll_x = 0  # For scrolling tabs if too many
+        self._last_sheets_version = -1  # Sprite manager version the tabs were built from
         
         # Colors for different elements
         self.info_text_color = (60, 60, 60)
@@ -51,9 +56,31 @@ class SpriteSheetBrowserPanel(Panel):
         self.edit_mode = None  # 'tile_w','tile_h','margin','spacing'
         self.edit_text = ''
         self.fields_rects = {}  # store rects for click detection
+        
+        # Cached info strings (rebuilt only when the sheet or its grid changes)
+        self._cached_size_text = None
+        self._cached_tiles_text = None
+        self._cached_info_key = None
+        
+        # Splitter drag state: while resizing, the last rendered content is
+        # scaled to the new size instead of being re-rendered every frame
+        self._resizing = False
+        self._cached_panel: Optional[pygame.Surface] = None
+        
+        # Pre-rendered close button icon (blitted once per tab)
+        self._close_icon = pygame.Surface((15, 20))
+        self._close_icon.fill((200, 200, 200))
+        pygame.draw.line(self._close_icon, (100, 100, 100), (3, 5), (12, 15))
+        pygame.draw.line(self._close_icon, (100, 100, 100), (12, 5), (3, 15))
     
     def update_tabs(self):
         """Update the tab list based on loaded sprite sheets."""
+        # Skip the rebuild unless the sprite manager's sheets changed
+        v = getattr(self.sprite_manager, '_sheets_version', 0)
+        if v == self._last_sheets_version:
+            return
+        self._last_sheets_version = v
+        
         self.tabs.clear()
         sheet_ids = self.sprite_manager.get_all_sheet_ids()
         
@@ -111,7 +138,7 @@ class SpriteSheetBrowserPanel(Panel):
                 elif event.key == pygame.K_BACKSPACE:
                     self.edit_text = self.edit_text[:-1]
                     return True
-                elif event.unicode and (event.unicode.isdigit()):
+                elif event.unicode in _DIGITS:
                     if len(self.edit_text) < 4:
                         self.edit_text += event.unicode
                     return True
@@ -192,13 +219,30 @@ class SpriteSheetBrowserPanel(Panel):
         if hasattr(self, 'on_load_requested'):
             self.on_load_requested()
     
+    def set_resizing(self, resizing: bool):
+        """Mark the start or end of a splitter drag that resizes this panel."""
+        self._resizing = resizing
+        if not resizing:
+            # Drop the snapshot so the next frame renders at the final size
+            self._cached_panel = None
+    
     def render_content(self, surface: pygame.Surface):
         """Render the sprite sheet info content."""
+        content_rect = self.get_content_rect().clip(surface.get_rect())
+        if self._resizing and self._cached_panel and content_rect.width > 0 and content_rect.height > 0:
+            # Scale the snapshot straight into the destination during a drag
+            pygame.transform.scale(self._cached_panel, content_rect.size,
+                                   surface.subsurface(content_rect))
+            return
+        
         # Render active sheet information
         self._render_sheet_info(surface)
         
         # Render load button
         self._render_load_button(surface)
+        
+        if self._resizing and content_rect.width > 0 and content_rect.height > 0:
+            self._cached_panel = surface.subsurface(content_rect).copy()
     
     def set_active_spritesheet(self, spritesheet, tab_info=None):
         """Set the active spritesheet to display info for.
@@ -209,9 +253,32 @@ class SpriteSheetBrowserPanel(Panel):
         """
         self.active_spritesheet = spritesheet
         self.active_tab_info = tab_info
+        self._update_cached_info_text()
+    
+    @staticmethod
+    def _info_key(sheet):
+        """Key the cached strings on the sheet and its current grid."""
+        return (sheet, getattr(sheet, 'rows', None), getattr(sheet, 'cols', None),
+                getattr(sheet, 'tile_size', None), getattr(sheet, 'surface', None))
+    
+    def _update_cached_info_text(self):
+        """Rebuild the size and tile count strings for the active sheet."""
+        self._cached_size_text = None
+        self._cached_tiles_text = None
+        sheet = getattr(self, 'active_spritesheet', None)
+        self._cached_info_key = self._info_key(sheet) if sheet else None
+        if not sheet:
+            return
+        if hasattr(sheet, 'surface') and sheet.surface:
+            self._cached_size_text = f"{sheet.surface.get_width()}x{sheet.surface.get_height()}"
+        if hasattr(sheet, 'get_tile_count'):
+            tile_count = sheet.get_tile_count()
+            if tile_count > 0 and hasattr(sheet, 'rows'):
+                self._cached_tiles_text = f"Tiles: {tile_count} ({sheet.rows}x{sheet.cols})"
     
     def _render_tabs(self, surface: pygame.Surface):
         """Render the sprite sheet tabs."""
+        close_blits = []
         for tab in self.tabs:
             # Determine tab color
             if tab['id'] == self.active_tab_id:
@@ -229,18 +296,12 @@ class SpriteSheetBrowserPanel(Panel):
             text_y = tab['rect'].y + (tab['rect'].height - text_surface.get_height()) // 2
             surface.blit(text_surface, (text_x, text_y))
             
-            # Draw close button (X)
-            close_rect = tab['close_rect']
-            pygame.draw.rect(surface, (200, 200, 200), close_rect)
-            
-            # Draw X
-            x_color = (100, 100, 100)
-            pygame.draw.line(surface, x_color, 
-                           (close_rect.x + 3, close_rect.y + 5),
-                           (close_rect.right - 3, close_rect.bottom - 5))
-            pygame.draw.line(surface, x_color,
-                           (close_rect.right - 3, close_rect.y + 5),
-                           (close_rect.x + 3, close_rect.bottom - 5))
+            # Queue close button (X)
+            close_blits.append((self._close_icon, tab['close_rect'].topleft))
+        
+        # Draw all close buttons in a single batched call
+        if close_blits:
+            surface.blits(close_blits, False)
     
     def _commit_field_edit(self):
         """Commit the edited value for a field."""
@@ -262,6 +323,7 @@ class SpriteSheetBrowserPanel(Panel):
                 # Apply change via reconfigure_grid if available
                 if hasattr(sheet, 'reconfigure_grid'):
                     sheet.reconfigure_grid((tw, th), margin=margin, spacing=spacing)
+                    self._update_cached_info_text()
                 # Clear any cached selection/analysis in parent (if accessible)
                 if hasattr(self.project, 'main_window'):
                     mw = self.project.main_window
@@ -288,6 +350,7 @@ class SpriteSheetBrowserPanel(Panel):
                     # Cache for subsequent frames
                     if active_sheet:
                         self.active_spritesheet = active_sheet
+                        self._update_cached_info_text()
             except Exception:
                 pass
         if not active_sheet:
@@ -303,6 +366,10 @@ class SpriteSheetBrowserPanel(Panel):
             surface.blit(hint_surface, (info_x, info_y + 25))
             return
         
+        # The grid can be reconfigured behind the panel's back (e.g. Aseprite import)
+        if self._info_key(active_sheet) != self._cached_info_key:
+            self._update_cached_info_text()
+        
         # Starting position for info display (no tab height needed now)
         info_x = self.x + 10
         info_y = self.y + 40
@@ -323,9 +390,8 @@ class SpriteSheetBrowserPanel(Panel):
             info_y += self.line_height
         
         # Dimensions
-        if hasattr(active_sheet, 'surface') and active_sheet.surface:
-            size_text = f"{active_sheet.surface.get_width()}x{active_sheet.surface.get_height()}"
-            self._render_info_line(surface, "Size:", size_text, info_x, info_y)
+        if self._cached_size_text:
+            self._render_info_line(surface, "Size:", self._cached_size_text, info_x, info_y)
             info_y += self.line_height
         
         # Editable fields
@@ -365,12 +431,9 @@ class SpriteSheetBrowserPanel(Panel):
         info_y += self.line_height
         
         # Tile count and grid
-        if hasattr(active_sheet, 'get_tile_count'):
-            tile_count = active_sheet.get_tile_count()
-            if tile_count > 0 and hasattr(active_sheet, 'rows'):
-                count_text = f"Tiles: {tile_count} ({active_sheet.rows}x{active_sheet.cols})"
-                surface.blit(font.render(count_text, True, self.info_text_color), (info_x, info_y))
-                info_y += self.line_height
+        if self._cached_tiles_text:
+            surface.blit(font.render(self._cached_tiles_text, True, self.info_text_color), (info_x, info_y))
+            info_y += self.line_height
         
         # Editing hint
         if not self.edit_mode:
@@ -0,0 +1,402 @@
+"""
+Tabbed settings dialog for the Sprite Animation Tool preferences.
+"""
+
+import os
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox, colorchooser
+from typing import Dict, Any, Tuple, Callable
+
+from ui.preferences import PreferencesManager
+
+
+# Preference keys edited by the dialog, per category
+_BOUND_KEYS: Dict[str, Tuple[str, ...]] = {
+    "general": ("default_export_dir", "animation_naming_pattern", "auto_save_interval",
+                "recent_files_limit", "remember_window_state", "show_tooltips"),
+    "display": ("grid_color", "selection_color", "ui_theme", "show_frame_numbers", "show_tile_info"),
+    "file_management": ("auto_cleanup_orphaned", "backup_animations", "recent_sprite_sheets"),
+    "advanced": ("memory_limit_mb", "max_undo_levels", "tile_cache_size", "enable_debug_logging",
+                 "background_processing", "use_aseprite_json"),
+}
+
+
+class SettingsDialog:
+    """Tabbed settings dialog for user preferences."""
+    
+    def __init__(self, parent, preferences_manager: PreferencesManager):
+        """Initialize the settings dialog."""
+        self.parent = parent
+        self.prefs = preferences_manager
+        # Values of just the dialog's keys when it opened (not a full copy)
+        original = self._snapshot(preferences_manager.preferences)
+        # Recent files live in the manager between saves, not in the stored list;
+        # existence is only checked when the File tab lists them
+        original["file_management"]["recent_sprite_sheets"] = preferences_manager.get_recent_files(check_exists=False)
+        self._original = {(c, k): v for c, kv in original.items() for k, v in kv.items()}
+        # Working copy edited by the widgets
+        self.temp_prefs = self._snapshot(original)
+        
+        # Create dialog window
+        self.dialog = tk.Toplevel()
+        self.dialog.title("Preferences")
+        self.dialog.geometry("500x400")
+        self.dialog.resizable(True, True)
+        self.dialog.transient(parent if parent else None)
+        self.dialog.grab_set()
+        
+        # Center the dialog
+        self.dialog.geometry("+%d+%d" % (
+            self.dialog.winfo_screenwidth() // 2 - 250,
+            self.dialog.winfo_screenheight() // 2 - 200
+        ))
+        
+        self.setup_ui()
+    
+    def _snapshot(self, source: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Copy the dialog-bound keys out of a preferences dict."""
+        snapshot = {}
+        for category, keys in _BOUND_KEYS.items():
+            values = source.get(category, {})
+            snapshot[category] = {}
+            for key in keys:
+                value = values.get(key, self.prefs.defaults[category][key])
+                snapshot[category][key] = list(value) if isinstance(value, list) else value
+        return snapshot
+    
+    def setup_ui(self):
+        """Set up the settings dialog UI."""
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(self.dialog)
+        self.notebook.pack(fill="both", expand=True, padx=10, pady=10)
+        
+        # Create tab placeholders; each tab's widgets are built on first view
+        self._tab_builders: Dict[str, Tuple[str, Callable, Any]] = {}
+        self._built_tabs = set()
+        for name, text, builder in (
+            ("general", "General", self.create_general_tab),
+            ("display", "Display", self.create_display_tab),
+            ("file_management", "File Management", self.create_file_management_tab),
+            ("advanced", "Advanced", self.create_advanced_tab),
+        ):
+            frame = ttk.Frame(self.notebook)
+            self.notebook.add(frame, text=text)
+            self._tab_builders[str(frame)] = (name, builder, frame)
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        # Build the initially selected (General) tab right away
+        self._on_tab_changed()
+        
+        # Buttons frame
+        button_frame = tk.Frame(self.dialog)
+        button_frame.pack(fill="x", padx=10, pady=5)
+        
+        # Buttons
+        tk.Button(button_frame, text="Reset to Defaults", 
+                 command=self.reset_to_defaults).pack(side="left")
+        
+        tk.Frame(button_frame).pack(side="left", expand=True)  # Spacer
+        
+        tk.Button(button_frame, text="Cancel", 
+                 command=self.cancel).pack(side="right", padx=5)
+        tk.Button(button_frame, text="OK", 
+                 command=self.ok).pack(side="right")
+    
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab's widgets the first time it is shown."""
+        entry = self._tab_builders.pop(self.notebook.select(), None)
+        if entry:
+            name, builder, frame = entry
+            builder(frame)
+            self._built_tabs.add(name)
+    
+    def create_general_tab(self, frame):
+        """Create the general settings tab."""
+        # Default export directory
+        tk.Label(frame, text="Default Export Directory:").grid(row=0, column=0, sticky="w", pady=5)
+        self.export_dir_var = tk.StringVar(value=self.temp_prefs["general"]["default_export_dir"])
+        export_frame = tk.Frame(frame)
+        export_frame.grid(row=0, column=1, sticky="ew", padx=10)
+        tk.Entry(export_frame, textvariable=self.export_dir_var, width=30).pack(side="left", fill="x", expand=True)
+        tk.Button(export_frame, text="Browse", command=self.browse_export_dir).pack(side="right")
+        
+        # Animation naming pattern
+        tk.Label(frame, text="Animation Naming Pattern:").grid(row=1, column=0, sticky="w", pady=5)
+        self.naming_pattern_var = tk.StringVar(value=self.temp_prefs["general"]["animation_naming_pattern"])
+        tk.Entry(frame, textvariable=self.naming_pattern_var, width=30).grid(row=1, column=1, sticky="ew", padx=10)
+        
+        # Auto-save interval
+        tk.Label(frame, text="Auto-save Interval (seconds):").grid(row=2, column=0, sticky="w", pady=5)
+        self.autosave_var = tk.IntVar(value=self.temp_prefs["general"]["auto_save_interval"])
+        tk.Spinbox(frame, from_=60, to=3600, textvariable=self.autosave_var, width=10).grid(row=2, column=1, sticky="w", padx=10)
+        
+        # Recent files limit
+        tk.Label(frame, text="Recent Files Limit:").grid(row=3, column=0, sticky="w", pady=5)
+        self.recent_limit_var = tk.IntVar(value=self.temp_prefs["general"]["recent_files_limit"])
+        tk.Spinbox(frame, from_=5, to=20, textvariable=self.recent_limit_var, width=10).grid(row=3, column=1, sticky="w", padx=10)
+        
+        # Checkboxes
+        self.remember_window_var = tk.BooleanVar(value=self.temp_prefs["general"]["remember_window_state"])
+        tk.Checkbutton(frame, text="Remember window size and position", 
+                      variable=self.remember_window_var).grid(row=4, columnspan=2, sticky="w", pady=5)
+        
+        self.show_tooltips_var = tk.BooleanVar(value=self.temp_prefs["general"]["show_tooltips"])
+        tk.Checkbutton(frame, text="Show tooltips", 
+                      variable=self.show_tooltips_var).grid(row=5, columnspan=2, sticky="w", pady=5)
+        
+        frame.columnconfigure(1, weight=1)
+    
+    def create_display_tab(self, frame):
+        """Create the display settings tab."""
+        # Grid color
+        tk.Label(frame, text="Grid Color:").grid(row=0, column=0, sticky="w", pady=5)
+        self.grid_color_var = tk.StringVar(value=self.temp_prefs["display"]["grid_color"])
+        color_frame = tk.Frame(frame)
+        color_frame.grid(row=0, column=1, sticky="ew", padx=10)
+        self.grid_color_button = tk.Button(color_frame, text="    ", 
+                                         bg=self.grid_color_var.get(),
+                                         command=lambda: self.choose_color(self.grid_color_var, self.grid_color_button))
+        self.grid_color_button.pack(side="left")
+        tk.Entry(color_frame, textvariable=self.grid_color_var, width=10).pack(side="left", padx=5)
+        
+        # Selection color
+        tk.Label(frame, text="Selection Color:").grid(row=1, column=0, sticky="w", pady=5)
+        self.selection_color_var = tk.StringVar(value=self.temp_prefs["display"]["selection_color"])
+        color_frame2 = tk.Frame(frame)
+        color_frame2.grid(row=1, column=1, sticky="ew", padx=10)
+        self.selection_color_button = tk.Button(color_frame2, text="    ", 
+                                              bg=self.selection_color_var.get(),
+                                              command=lambda: self.choose_color(self.selection_color_var, self.selection_color_button))
+        self.selection_color_button.pack(side="left")
+        tk.Entry(color_frame2, textvariable=self.selection_color_var, width=10).pack(side="left", padx=5)
+        
+        # UI Theme
+        tk.Label(frame, text="UI Theme:").grid(row=2, column=0, sticky="w", pady=5)
+        self.theme_var = tk.StringVar(value=self.temp_prefs["display"]["ui_theme"])
+        theme_combo = ttk.Combobox(frame, textvariable=self.theme_var, values=["default", "dark", "light"])
+        theme_combo.grid(row=2, column=1, sticky="w", padx=10)
+        theme_combo.state(['readonly'])
+        
+        # Checkboxes
+        self.show_frame_numbers_var = tk.BooleanVar(value=self.temp_prefs["display"]["show_frame_numbers"])
+        tk.Checkbutton(frame, text="Show frame numbers", 
+                      variable=self.show_frame_numbers_var).grid(row=3, columnspan=2, sticky="w", pady=5)
+        
+        self.show_tile_info_var = tk.BooleanVar(value=self.temp_prefs["display"]["show_tile_info"])
+        tk.Checkbutton(frame, text="Show tile information", 
+                      variable=self.show_tile_info_var).grid(row=4, columnspan=2, sticky="w", pady=5)
+        
+        frame.columnconfigure(1, weight=1)
+    
+    def create_file_management_tab(self, frame):
+        """Create the file management tab."""
+        # Checkboxes
+        self.auto_cleanup_var = tk.BooleanVar(value=self.temp_prefs["file_management"]["auto_cleanup_orphaned"])
+        tk.Checkbutton(frame, text="Automatically cleanup orphaned animation files", 
+                      variable=self.auto_cleanup_var).grid(row=0, columnspan=2, sticky="w", pady=5)
+        
+        self.backup_animations_var = tk.BooleanVar(value=self.temp_prefs["file_management"]["backup_animations"])
+        tk.Checkbutton(frame, text="Create backup copies of animation files", 
+                      variable=self.backup_animations_var).grid(row=1, columnspan=2, sticky="w", pady=5)
+        
+        # Recent files management
+        tk.Label(frame, text="Recent Files:").grid(row=2, column=0, sticky="nw", pady=10)
+        recent_frame = tk.Frame(frame)
+        recent_frame.grid(row=2, column=1, sticky="ew", padx=10, pady=10)
+        
+        # Recent files listbox with scrollbar
+        listbox_frame = tk.Frame(recent_frame)
+        listbox_frame.pack(fill="both", expand=True)
+        
+        self.recent_listbox = tk.Listbox(listbox_frame, height=6)
+        scrollbar = tk.Scrollbar(listbox_frame, orient="vertical", command=self.recent_listbox.yview)
+        self.recent_listbox.configure(yscrollcommand=scrollbar.set)
+        
+        self.recent_listbox.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        
+        # Populate recent files list
+        for file_path in self.prefs.get_recent_files():
+            self.recent_listbox.insert(tk.END, os.path.basename(file_path))
+        
+        # Recent files buttons
+        button_frame = tk.Frame(recent_frame)
+        button_frame.pack(fill="x", pady=5)
+        tk.Button(button_frame, text="Clear All", command=self.clear_recent_files).pack(side="right")
+        
+        frame.columnconfigure(1, weight=1)
+    
+    def create_advanced_tab(self, frame):
+        """Create the advanced settings tab."""
+        # Memory limit
+        tk.Label(frame, text="Memory Limit (MB):").grid(row=0, column=0, sticky="w", pady=5)
+        self.memory_limit_var = tk.IntVar(value=self.temp_prefs["advanced"]["memory_limit_mb"])
+        tk.Spinbox(frame, from_=256, to=2048, textvariable=self.memory_limit_var, width=10).grid(row=0, column=1, sticky="w", padx=10)
+        
+        # Max undo levels
+        tk.Label(frame, text="Maximum Undo Levels:").grid(row=1, column=0, sticky="w", pady=5)
+        self.undo_levels_var = tk.IntVar(value=self.temp_prefs["advanced"]["max_undo_levels"])
+        tk.Spinbox(frame, from_=10, to=100, textvariable=self.undo_levels_var, width=10).grid(row=1, column=1, sticky="w", padx=10)
+        
+        # Tile cache size
+        tk.Label(frame, text="Tile Cache Size:").grid(row=2, column=0, sticky="w", pady=5)
+        self.cache_size_var = tk.IntVar(value=self.temp_prefs["advanced"]["tile_cache_size"])
+        tk.Spinbox(frame, from_=100, to=5000, textvariable=self.cache_size_var, width=10).grid(row=2, column=1, sticky="w", padx=10)
+        
+        # Checkboxes
+        self.debug_logging_var = tk.BooleanVar(value=self.temp_prefs["advanced"]["enable_debug_logging"])
+        tk.Checkbutton(frame, text="Enable debug logging", 
+                      variable=self.debug_logging_var).grid(row=3, columnspan=2, sticky="w", pady=5)
+        
+        self.background_processing_var = tk.BooleanVar(value=self.temp_prefs["advanced"]["background_processing"])
+        tk.Checkbutton(frame, text="Enable background processing", 
+                      variable=self.background_processing_var).grid(row=4, columnspan=2, sticky="w", pady=5)
+
+        # Aseprite JSON usage toggle (after background processing)
+        self.use_aseprite_json_var = tk.BooleanVar(value=self.temp_prefs["advanced"]["use_aseprite_json"])
+        ttk.Checkbutton(frame, text="Use Aseprite JSON Data (auto-detect .json next to .png)", 
+                        variable=self.use_aseprite_json_var).grid(row=5, columnspan=2, sticky="w", pady=5)
+        # Adjust following rows indices (+1)
+        button_frame = tk.Frame(frame)
+        button_frame.grid(row=6, columnspan=2, sticky="ew", pady=20)
+        tk.Button(button_frame, text="Export Preferences", command=self.export_preferences).pack(side="left")
+        tk.Button(button_frame, text="Import Preferences", command=self.import_preferences).pack(side="left", padx=10)
+        frame.columnconfigure(1, weight=1)
+    
+    def browse_export_dir(self):
+        """Browse for export directory."""
+        directory = filedialog.askdirectory(initialdir=self.export_dir_var.get())
+        if directory:
+            self.export_dir_var.set(directory)
+    
+    def choose_color(self, color_var: tk.StringVar, button: tk.Button):
+        """Choose a color using color picker."""
+        color = colorchooser.askcolor(color=color_var.get())
+        if color[1]:  # If a color was selected
+            color_var.set(color[1])
+            button.config(bg=color[1])
+    
+    def clear_recent_files(self):
+        """Clear the recent files list."""
+        if messagebox.askyesno("Clear Recent Files", "Are you sure you want to clear all recent files?"):
+            self.recent_listbox.delete(0, tk.END)
+            self.temp_prefs["file_management"]["recent_sprite_sheets"] = []
+    
+    def export_preferences(self):
+        """Export preferences to a file."""
+        file_path = filedialog.asksaveasfilename(
+            title="Export Preferences",
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if file_path:
+            if self.prefs.export_preferences(file_path):
+                messagebox.showinfo("Success", "Preferences exported successfully!")
+            else:
+                messagebox.showerror("Error", "Failed to export preferences.")
+    
+    def import_preferences(self):
+        """Import preferences from a file."""
+        file_path = filedialog.askopenfilename(
+            title="Import Preferences",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
+        if file_path:
+            if self.prefs.import_preferences(file_path):
+                messagebox.showinfo("Success", "Preferences imported successfully!\nRestart the application to see all changes.")
+                self.dialog.destroy()
+            else:
+                messagebox.showerror("Error", "Failed to import preferences.")
+    
+    def reset_to_defaults(self):
+        """Reset all preferences to defaults."""
+        if messagebox.askyesno("Reset Preferences", "Are you sure you want to reset all preferences to defaults?"):
+            self.temp_prefs = self._snapshot(self.prefs.defaults)
+            self.update_ui_from_prefs()
+    
+    def update_ui_from_prefs(self):
+        """Update UI controls from temporary preferences."""
+        # Tabs that haven't been built yet read temp_prefs when they are
+        if "general" in self._built_tabs:
+            self._update_general_tab()
+        if "display" in self._built_tabs:
+            self._update_display_tab()
+        if "file_management" in self._built_tabs:
+            self._update_file_management_tab()
+        if "advanced" in self._built_tabs:
+            self._update_advanced_tab()
+    
+    def _update_general_tab(self):
+        self.export_dir_var.set(self.temp_prefs["general"]["default_export_dir"])
+        self.naming_pattern_var.set(self.temp_prefs["general"]["animation_naming_pattern"])
+        self.autosave_var.set(self.temp_prefs["general"]["auto_save_interval"])
+        self.recent_limit_var.set(self.temp_prefs["general"]["recent_files_limit"])
+        self.remember_window_var.set(self.temp_prefs["general"]["remember_window_state"])
+        self.show_tooltips_var.set(self.temp_prefs["general"]["show_tooltips"])
+    
+    def _update_display_tab(self):
+        self.grid_color_var.set(self.temp_prefs["display"]["grid_color"])
+        self.grid_color_button.config(bg=self.grid_color_var.get())
+        self.selection_color_var.set(self.temp_prefs["display"]["selection_color"])
+        self.selection_color_button.config(bg=self.selection_color_var.get())
+        self.theme_var.set(self.temp_prefs["display"]["ui_theme"])
+        self.show_frame_numbers_var.set(self.temp_prefs["display"]["show_frame_numbers"])
+        self.show_tile_info_var.set(self.temp_prefs["display"]["show_tile_info"])
+    
+    def _update_file_management_tab(self):
+        self.auto_cleanup_var.set(self.temp_prefs["file_management"]["auto_cleanup_orphaned"])
+        self.backup_animations_var.set(self.temp_prefs["file_management"]["backup_animations"])
+    
+    def _update_advanced_tab(self):
+        self.memory_limit_var.set(self.temp_prefs["advanced"]["memory_limit_mb"])
+        self.undo_levels_var.set(self.temp_prefs["advanced"]["max_undo_levels"])
+        self.cache_size_var.set(self.temp_prefs["advanced"]["tile_cache_size"])
+        self.debug_logging_var.set(self.temp_prefs["advanced"]["enable_debug_logging"])
+        self.background_processing_var.set(self.temp_prefs["advanced"]["background_processing"])
+        self.use_aseprite_json_var.set(self.temp_prefs["advanced"]["use_aseprite_json"])
+    
+    def collect_ui_values(self):
+        """Collect values from UI controls into temporary preferences."""
+        # Only built tabs have widgets; the rest keep their temp_prefs values
+        if "general" in self._built_tabs:
+            self.temp_prefs["general"]["default_export_dir"] = self.export_dir_var.get()
+            self.temp_prefs["general"]["animation_naming_pattern"] = self.naming_pattern_var.get()
+            self.temp_prefs["general"]["auto_save_interval"] = self.autosave_var.get()
+            self.temp_prefs["general"]["recent_files_limit"] = self.recent_limit_var.get()
+            self.temp_prefs["general"]["remember_window_state"] = self.remember_window_var.get()
+            self.temp_prefs["general"]["show_tooltips"] = self.show_tooltips_var.get()
+        
+        if "display" in self._built_tabs:
+            self.temp_prefs["display"]["grid_color"] = self.grid_color_var.get()
+            self.temp_prefs["display"]["selection_color"] = self.selection_color_var.get()
+            self.temp_prefs["display"]["ui_theme"] = self.theme_var.get()
+            self.temp_prefs["display"]["show_frame_numbers"] = self.show_frame_numbers_var.get()
+            self.temp_prefs["display"]["show_tile_info"] = self.show_tile_info_var.get()
+        
+        if "file_management" in self._built_tabs:
+            self.temp_prefs["file_management"]["auto_cleanup_orphaned"] = self.auto_cleanup_var.get()
+            self.temp_prefs["file_management"]["backup_animations"] = self.backup_animations_var.get()
+        
+        if "advanced" in self._built_tabs:
+            self.temp_prefs["advanced"]["memory_limit_mb"] = self.memory_limit_var.get()
+            self.temp_prefs["advanced"]["max_undo_levels"] = self.undo_levels_var.get()
+            self.temp_prefs["advanced"]["tile_cache_size"] = self.cache_size_var.get()
+            self.temp_prefs["advanced"]["enable_debug_logging"] = self.debug_logging_var.get()
+            self.temp_prefs["advanced"]["background_processing"] = self.background_processing_var.get()
+            # Commit advanced tab values (ensure key exists)
+            self.temp_prefs["advanced"]["use_aseprite_json"] = self.use_aseprite_json_var.get()
+    
+    def ok(self):
+        """Apply changes and close dialog."""
+        self.collect_ui_values()
+        # Apply only what actually changed so observers fire once per real edit
+        with self.prefs.batch():
+            for (category, key), original in self._original.items():
+                value = self.temp_prefs[category][key]
+                if value != original:
+                    self.prefs.set(category, key, value)
+        self.prefs.flush()
+        self.dialog.destroy()
+    
+    def cancel(self):
+        """Close dialog without applying changes."""
+        self.dialog.destroy()
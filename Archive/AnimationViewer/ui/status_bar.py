@@ -4,10 +4,110 @@ This implements Phase 1.9 Status Bar and User Feedback with real-time informatio
 """
 import pygame
 import psutil
-import os
-from typing import Optional, Dict, Any, Tuple, List
+from typing import Optional, Dict, Tuple
 import time
 import threading
+from collections import OrderedDict
+
+
+# Maximum number of rendered text surfaces kept by StatusBar._render_text
+_TEXT_CACHE_MAX = 256
+# Maximum number of measured text widths kept by StatusBar._text_width
+_SIZE_CACHE_MAX = 512
+
+# Fonts shared across StatusBar instances, keyed by (name, size, bold)
+_FONT_CACHE: Dict[Tuple[str, int, bool], "pygame.font.Font"] = {}
+
+
+def _get_font(name: str, size: int, bold: bool = False) -> "pygame.font.Font":
+    """Return a cached system font, falling back to the default font."""
+    key = (name, size, bold)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        try:
+            font = pygame.font.SysFont(name, size, bold=bold)
+        except Exception:
+            font = pygame.font.Font(None, 12)
+        _FONT_CACHE[key] = font
+    return font
+
+
+# Section text templates for the frequently called setters
+_FMT_SHEET_DIMS = "Sheet: {} ({} tiles, {}x{})"
+_FMT_SHEET = "Sheet: {} ({} tiles)"
+_FMT_MOUSE_FRAME_IDX = "Mouse: ({}, {}) | Frame: ({}, {}) #{}"
+_FMT_MOUSE_FRAME = "Mouse: ({}, {}) | Frame: ({}, {})"
+_FMT_MOUSE = "Mouse: ({}, {})"
+
+_EDGE_PADDING = 10
+_SECTION_PADDING = 10
+
+
+def _compute_layout(left, right, width):
+    """Compute section spans for the status bar.
+    
+    left and right are sequences of (min_width, max_width, text_width) rows.
+    Returns a list of (x, width) spans for left then right rows, followed by
+    the x position and width of the main section filling the gap.
+    """
+    spans = []
+    x = _EDGE_PADDING
+    for min_width, max_width, text_width in left:
+        section_width = min(max(text_width + 10, min_width), max_width)
+        spans.append((x, section_width))
+        x += section_width + _SECTION_PADDING
+    
+    right_x = width - _EDGE_PADDING
+    for min_width, max_width, text_width in right:
+        section_width = min(max(text_width + 10, min_width), max_width)
+        right_x -= section_width
+        spans.append((right_x, section_width))
+        right_x -= _SECTION_PADDING
+    
+    return spans, x, max(100, right_x - x - _SECTION_PADDING)
+
+
+class _ProcessSampler:
+    """Process-wide memory/CPU sampler shared by every status bar."""
+    
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self.rss_mb: Optional[float] = None
+        self.cpu_percent = 0.0
+        self._proc = psutil.Process()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="ProcessSampler", daemon=True)
+        self._thread.start()
+    
+    def _loop(self):
+        """Sample the process until stopped."""
+        while not self._stop.is_set():
+            try:
+                # oneshot() batches the /proc reads behind every metric below
+                with self._proc.oneshot():
+                    rss = self._proc.memory_info().rss
+                    self.cpu_percent = self._proc.cpu_percent(interval=None)
+                self.rss_mb = rss / (1024 * 1024)  # Convert to MB
+            except Exception:
+                self.rss_mb = None
+            self._stop.wait(self.interval)
+    
+    def stop(self):
+        """Stop the background thread."""
+        self._stop.set()
+
+
+_SAMPLER: Optional[_ProcessSampler] = None
+_SAMPLER_LOCK = threading.Lock()
+
+
+def _get_sampler() -> _ProcessSampler:
+    """Return the shared process sampler, starting it on first use."""
+    global _SAMPLER
+    with _SAMPLER_LOCK:
+        if _SAMPLER is None:
+            _SAMPLER = _ProcessSampler()
+        return _SAMPLER
 
 
 class StatusSection:
@@ -22,15 +122,55 @@ class StatusSection:
         self.visible = True
         self.clickable = False
         self.callback = None
+        self._on_change = None
     
     def set_text(self, text: str):
         """Set the text for this section."""
-        self.text = text
+        if text != self.text:
+            self.text = text
+            if self._on_change:
+                self._on_change()
+    
+    def set_visible(self, visible: bool):
+        """Show or hide this section."""
+        if visible != self.visible:
+            self.visible = visible
+            if self._on_change:
+                self._on_change()
     
     def set_clickable(self, callback):
         """Make this section clickable with a callback."""
         self.clickable = True
         self.callback = callback
+        if self._on_change:
+            self._on_change()
+
+
+class _Sections:
+    """Fixed set of status bar sections with attribute access."""
+    
+    __slots__ = ("main", "sheet_info", "selection", "mouse_info", "operation", "memory", "time",
+                 "_all", "_left", "_right")
+    
+    def __init__(self, **sections: StatusSection):
+        for name, section in sections.items():
+            setattr(self, name, section)
+        self._all = tuple(sections.values())
+        # Layout order; right sections are packed from the right edge
+        self._left = (self.sheet_info, self.selection, self.mouse_info, self.operation)
+        self._right = (self.memory, self.time)
+    
+    def __getitem__(self, name: str) -> StatusSection:
+        if name not in self:
+            raise KeyError(name)
+        return getattr(self, name)
+    
+    def __contains__(self, name: str) -> bool:
+        return name in self.__slots__ and not name.startswith("_")
+    
+    def values(self):
+        """Return all sections in display order."""
+        return self._all
 
 
 class StatusBar:
@@ -38,41 +178,62 @@ class StatusBar:
     Comprehensive status bar with multiple information sections and real-time updates.
     """
     
+    _MSG_TYPE_COLORS = {
+        "info": (70, 70, 70),
+        "success": (46, 125, 50),
+        "warning": (245, 124, 0),
+        "error": (211, 47, 47),
+    }
+    
     def __init__(self, height: int = 25):
         """Initialize the comprehensive status bar."""
         self.height = height
         self.rect = pygame.Rect(0, 0, 0, height)
         
         # Status sections
-        self.sections = {}
+        self.sections: Optional[_Sections] = None
+        self._layout_dirty = True
+        self._layout_y = None
+        self._any_clickable = False
+        self._visible_sections: list = []
+        self._blits_scratch: list = []  # reused by _render_sections
+        
+        # Retained rendering: the bar draws into its own strip, repainted only when something changes
+        self._needs_redraw = True
+        self._own_surface: Optional[pygame.Surface] = None
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._sep_tile: Optional[pygame.Surface] = None
+        self.min_redraw_interval = 1 / 30.0  # seconds
+        self._last_render = 0.0
+        self._hover_section: Optional[StatusSection] = None
         self._setup_sections()
         
         # Temporary messages
         self.temp_message = ""
         self.temp_message_time = 0
         self.temp_message_duration = 3.0
+        self._temp_message_deadline = 0.0  # time.monotonic() value
         self.temp_message_color = (70, 70, 70)
         
         # Operation progress
         self.operation_text = ""
         self.progress_value = 0.0  # 0.0 to 1.0
-        self.show_progress = False
+        self.progress_active = False
         self.progress_color = (100, 150, 200)
+        self._last_pct = -1
+        self._progress_text = ""
         
-        # Memory monitoring
+        # Memory monitoring (sampled on a background thread)
         self.memory_usage_mb = 0
         self.memory_update_time = 0
-        self.memory_update_interval = 2.0  # seconds
-        
-        # Status tracking attributes
-        self.sprite_sheet_name = ""
-        self.tile_count = 0
-        self.selected_count = 0
-        self.total_frames = None
-        self.mouse_pos = (0, 0)
-        self.frame_pos = None
-        self.frame_index = None
-        self.current_frame_info = ""
+        self._mem_shown: Optional[float] = -1.0
+        self._sampler = _get_sampler()
+        
+        # Last set_mouse_info arguments, to skip redundant updates
+        self._last_mouse_args = None
+        
+        # Clock display (refreshed once per second)
+        self._last_time_second = -1
         
         # Colors and styling
         self.bg_color = (248, 248, 248)
@@ -82,53 +243,82 @@ class StatusBar:
         self.highlight_color = (240, 240, 240)
         
         # Message type colors
-        self.info_color = (70, 70, 70)
-        self.success_color = (46, 125, 50)
-        self.warning_color = (245, 124, 0)
-        self.error_color = (211, 47, 47)
+        self.info_color = self._MSG_TYPE_COLORS["info"]
+        self.success_color = self._MSG_TYPE_COLORS["success"]
+        self.warning_color = self._MSG_TYPE_COLORS["warning"]
+        self.error_color = self._MSG_TYPE_COLORS["error"]
         
-        # Fonts
-        try:
-            self.font = pygame.font.SysFont("Segoe UI", 9)
-            self.bold_font = pygame.font.SysFont("Segoe UI", 9, bold=True)
-        except:
-            self.font = pygame.font.Font(None, 12)
-            self.bold_font = pygame.font.Font(None, 12)
+        # Fonts (shared by every status bar)
+        self.font = _get_font("Segoe UI", 9)
+        self.bold_font = _get_font("Segoe UI", 9, bold=True)
+        
+        # Rendered text surfaces keyed by (text, color, bold)
+        self._text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        # Measured text widths keyed by text (FIFO eviction)
+        self._size_cache: Dict[str, int] = {}
         
         # Animation for smooth updates
         self.last_update_time = time.time()
     
+    def _render_text(self, text: str, color: Tuple[int, int, int], bold: bool = False) -> pygame.Surface:
+        """Render text through a bounded LRU cache of surfaces."""
+        key = (text, color, bold)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            font = self.bold_font if bold else self.font
+            text_surface = font.render(text, True, color)
+            self._text_cache[key] = text_surface
+            if len(self._text_cache) > _TEXT_CACHE_MAX:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return text_surface
+    
+    def _text_width(self, text: str) -> int:
+        """Return the rendered width of text, memoizing font metrics."""
+        width = self._size_cache.get(text)
+        if width is None:
+            width = self.font.size(text)[0]
+            if len(self._size_cache) >= _SIZE_CACHE_MAX:
+                del self._size_cache[next(iter(self._size_cache))]
+            self._size_cache[text] = width
+        return width
+    
     def _setup_sections(self):
         """Set up the status bar sections."""
-        # Main status section (left side)
-        self.sections["main"] = StatusSection("main", 200, 400)
-        
-        # Sprite sheet info
-        self.sections["sheet_info"] = StatusSection("sheet_info", 150, 300)
-        
-        # Selection info
-        self.sections["selection"] = StatusSection("selection", 100, 200)
-        
-        # Mouse/Frame info
-        self.sections["mouse_info"] = StatusSection("mouse_info", 120, 250)
-        
-        # Operation status
-        self.sections["operation"] = StatusSection("operation", 100, 250)
-        
-        # Memory usage (right side)
-        self.sections["memory"] = StatusSection("memory", 80, 120)
-        
-        # Current time (rightmost)
-        self.sections["time"] = StatusSection("time", 60, 80)
+        self.sections = _Sections(
+            # Main status section (left side)
+            main=StatusSection("main", 200, 400),
+            # Sprite sheet info
+            sheet_info=StatusSection("sheet_info", 150, 300),
+            # Selection info
+            selection=StatusSection("selection", 100, 200),
+            # Mouse/Frame info
+            mouse_info=StatusSection("mouse_info", 120, 250),
+            # Operation status
+            operation=StatusSection("operation", 100, 250),
+            # Memory usage (right side)
+            memory=StatusSection("memory", 80, 120),
+            # Current time (rightmost)
+            time=StatusSection("time", 60, 80),
+        )
+        
+        for section in self.sections._all:
+            section._on_change = self._invalidate_layout
+    
+    def _invalidate_layout(self):
+        """Mark section rects as needing a relayout."""
+        self._layout_dirty = True
+        self._needs_redraw = True
     
     def set_sprite_sheet_info(self, name: str, tile_count: int, dimensions: Tuple[int, int] = None):
         """Set sprite sheet information."""
         if dimensions:
-            info_text = f"Sheet: {name} ({tile_count} tiles, {dimensions[0]}x{dimensions[1]})"
+            info_text = _FMT_SHEET_DIMS.format(name, tile_count, dimensions[0], dimensions[1])
         else:
-            info_text = f"Sheet: {name} ({tile_count} tiles)"
+            info_text = _FMT_SHEET.format(name, tile_count)
         
-        self.sections["sheet_info"].set_text(info_text)
+        self.sections.sheet_info.set_text(info_text)
     
     def set_selection_info(self, selected_count: int, total_frames: int = None):
         """Set frame selection information."""
@@ -138,20 +328,25 @@ class StatusBar:
         else:
             text = f"Selected: {selected_count} frames"
         
-        self.sections["selection"].set_text(text)
+        self.sections.selection.set_text(text)
     
     def set_mouse_info(self, mouse_pos: Tuple[int, int], frame_pos: Tuple[int, int] = None, 
                        frame_index: int = None):
         """Set mouse position and current frame information."""
+        args = (mouse_pos, frame_pos, frame_index)
+        if args == self._last_mouse_args:
+            return
+        self._last_mouse_args = args
+        
         if frame_pos is not None:
             if frame_index is not None:
-                text = f"Mouse: ({mouse_pos[0]}, {mouse_pos[1]}) | Frame: ({frame_pos[0]}, {frame_pos[1]}) #{frame_index}"
+                text = _FMT_MOUSE_FRAME_IDX.format(mouse_pos[0], mouse_pos[1], frame_pos[0], frame_pos[1], frame_index)
             else:
-                text = f"Mouse: ({mouse_pos[0]}, {mouse_pos[1]}) | Frame: ({frame_pos[0]}, {frame_pos[1]})"
+                text = _FMT_MOUSE_FRAME.format(mouse_pos[0], mouse_pos[1], frame_pos[0], frame_pos[1])
         else:
-            text = f"Mouse: ({mouse_pos[0]}, {mouse_pos[1]})"
+            text = _FMT_MOUSE.format(mouse_pos[0], mouse_pos[1])
         
-        self.sections["mouse_info"].set_text(text)
+        self.sections.mouse_info.set_text(text)
     
     def set_operation_status(self, operation: str, details: str = ""):
         """Set current operation status."""
@@ -160,23 +355,33 @@ class StatusBar:
         else:
             text = operation
         
-        self.sections["operation"].set_text(text)
+        self.sections.operation.set_text(text)
     
     def clear_operation_status(self):
         """Clear the operation status."""
-        self.sections["operation"].set_text("")
+        self.sections.operation.set_text("")
     
     def show_progress(self, operation: str, progress: float):
         """Show progress bar for long operations."""
-        self.operation_text = operation
         self.progress_value = max(0.0, min(1.0, progress))
-        self.show_progress = True
+        
+        # Only repaint when the whole-percent value or the operation changes
+        pct = int(self.progress_value * 100)
+        if pct == self._last_pct and operation == self.operation_text and self.progress_active:
+            return
+        self._last_pct = pct
+        self.operation_text = operation
+        self._progress_text = f"{operation} ({pct}%)"
+        self.progress_active = True
+        self._needs_redraw = True
     
     def hide_progress(self):
         """Hide the progress bar."""
-        self.show_progress = False
+        self.progress_active = False
         self.operation_text = ""
         self.progress_value = 0.0
+        self._last_pct = -1
+        self._needs_redraw = True
     
     def show_temporary_message(self, message: str, duration: float = 3.0, 
                              message_type: str = "info"):
@@ -184,15 +389,11 @@ class StatusBar:
         self.temp_message = message
         self.temp_message_time = time.time()
         self.temp_message_duration = duration
+        self._temp_message_deadline = time.monotonic() + duration
+        self._needs_redraw = True
         
         # Set color based on message type
-        color_map = {
-            "info": self.info_color,
-            "success": self.success_color,
-            "warning": self.warning_color,
-            "error": self.error_color
-        }
-        self.temp_message_color = color_map.get(message_type, self.info_color)
+        self.temp_message_color = self._MSG_TYPE_COLORS.get(message_type, self._MSG_TYPE_COLORS["info"])
     
     def show_info(self, message: str):
         """Show an info message."""
@@ -212,34 +413,38 @@ class StatusBar:
     
     def update_memory_usage(self):
         """Update memory usage information."""
-        current_time = time.time()
-        if current_time - self.memory_update_time > self.memory_update_interval:
-            try:
-                process = psutil.Process()
-                memory_info = process.memory_info()
-                self.memory_usage_mb = memory_info.rss / (1024 * 1024)  # Convert to MB
-                
-                # Format memory usage
-                if self.memory_usage_mb > 1024:
-                    memory_text = f"Mem: {self.memory_usage_mb/1024:.1f}GB"
-                else:
-                    memory_text = f"Mem: {self.memory_usage_mb:.0f}MB"
-                
-                self.sections["memory"].set_text(memory_text)
-                self.memory_update_time = current_time
-                
-            except Exception:
-                self.sections["memory"].set_text("Mem: N/A")
+        mem_mb = self._sampler.rss_mb
+        if mem_mb == self._mem_shown:
+            return
+        self._mem_shown = mem_mb
+        
+        if mem_mb is None:
+            self.sections.memory.set_text("Mem: N/A")
+            return
+        
+        self.memory_usage_mb = mem_mb
+        self.memory_update_time = time.time()
+        
+        # Format memory usage
+        if mem_mb > 1024:
+            memory_text = f"Mem: {mem_mb/1024:.1f}GB"
+        else:
+            memory_text = f"Mem: {mem_mb:.0f}MB"
+        
+        self.sections.memory.set_text(memory_text)
     
     def update_time_display(self):
         """Update the current time display."""
-        current_time = time.strftime("%H:%M:%S")
-        self.sections["time"].set_text(current_time)
+        second = int(time.time())
+        if second == self._last_time_second:
+            return
+        self._last_time_second = second
+        self.sections.time.set_text(time.strftime("%H:%M:%S", time.localtime(second)))
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events for clickable sections."""
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            for section in self.sections.values():
+            for section in self.sections._all:
                 if section.clickable and section.rect.collidepoint(event.pos):
                     if section.callback:
                         section.callback()
@@ -252,66 +457,109 @@ class StatusBar:
         self.update_time_display()
         
         # Clear expired temporary messages
-        if (self.temp_message and 
-            time.time() - self.temp_message_time > self.temp_message_duration):
+        if self.temp_message and time.monotonic() >= self._temp_message_deadline:
             self.temp_message = ""
+            self._needs_redraw = True
     
     def resize(self, width: int):
         """Resize the status bar to fit the window width."""
         self.rect.width = width
+        self._layout_dirty = True
+        self._needs_redraw = True
         self._layout_sections()
+        if width > 0:
+            self._create_surfaces()
+            self._last_render = 0.0
     
     def _layout_sections(self):
         """Layout the sections within the status bar."""
-        available_width = self.rect.width - 20  # Padding
-        section_padding = 10
-        
-        # Calculate positions from left to right
-        x = 10
-        
-        # Left side sections
-        left_sections = ["sheet_info", "selection", "mouse_info", "operation"]
-        for section_name in left_sections:
-            if section_name in self.sections:
-                section = self.sections[section_name]
-                if section.visible and section.text:
-                    text_width = self.font.size(section.text)[0]
-                    section_width = min(max(text_width + 10, section.min_width), section.max_width)
-                    section.rect = pygame.Rect(x, self.rect.y + 2, section_width, self.height - 4)
-                    x += section_width + section_padding
-        
-        # Right side sections (from right to left)
-        right_sections = ["time", "memory"]
-        right_x = self.rect.width - 10
-        
-        for section_name in reversed(right_sections):
-            if section_name in self.sections:
-                section = self.sections[section_name]
-                if section.visible:
-                    text_width = self.font.size(section.text)[0] if section.text else 0
-                    section_width = min(max(text_width + 10, section.min_width), section.max_width)
-                    right_x -= section_width
-                    section.rect = pygame.Rect(right_x, self.rect.y + 2, section_width, self.height - 4)
-                    right_x -= section_padding
+        if not self._layout_dirty and self._layout_y == self.rect.y:
+            return
+        
+        # Gather (section, text_width) rows for the visible sections
+        sections = self.sections
+        left = [(section, self._text_width(section.text))
+                for section in sections._left if section.visible and section.text]
+        right = [(section, self._text_width(section.text) if section.text else 0)
+                 for section in sections._right if section.visible]
+        
+        spans, main_x, main_width = _compute_layout(
+            [(section.min_width, section.max_width, text_width) for section, text_width in left],
+            [(section.min_width, section.max_width, text_width) for section, text_width in right],
+            self.rect.width)
+        
+        y = self.rect.y + 2
+        h = self.height - 4
+        for (section, _), (x, width) in zip(left + right, spans):
+            section.rect.update(x, y, width, h)
         
         # Main section takes remaining space
-        if "main" in self.sections:
-            main_width = max(100, right_x - x - section_padding)
-            self.sections["main"].rect = pygame.Rect(x, self.rect.y + 2, main_width, self.height - 4)
+        sections.main.rect.update(main_x, y, main_width, h)
+        
+        self._any_clickable = any(section.clickable for section in self.sections._all)
+        self._visible_sections = [section for section in self.sections._all
+                                  if section.visible and section.text]
+        self._layout_dirty = False
+        self._layout_y = self.rect.y
+        self._needs_redraw = True
     
     def render(self, surface: pygame.Surface):
         """Render the comprehensive status bar."""
-        # Background
-        pygame.draw.rect(surface, self.bg_color, self.rect)
-        pygame.draw.line(surface, self.border_color, 
-                        (self.rect.left, self.rect.top), 
-                        (self.rect.right, self.rect.top))
-        
         # Layout sections
         self._layout_sections()
         
+        # Hover highlight only changes when the mouse enters or leaves a clickable section
+        if self._any_clickable:
+            mouse_pos = pygame.mouse.get_pos()
+            hover = next((section for section in self.sections._all
+                          if section.clickable and section.rect.collidepoint(mouse_pos)), None)
+            if hover is not self._hover_section:
+                self._hover_section = hover
+                self._needs_redraw = True
+        
+        own = self._own_surface
+        if own is None or own.get_size() != self.rect.size:
+            self._create_surfaces()
+            own = self._own_surface
+            self._needs_redraw = True
+            self._last_render = 0.0
+        
+        # Only repaint the strip when something changed, coalescing bursts of
+        # changes (e.g. mouse moves) to at most one repaint per min_redraw_interval
+        if self._needs_redraw:
+            now = time.monotonic()
+            if now - self._last_render >= self.min_redraw_interval:
+                self._draw(own)
+                self._needs_redraw = False
+                self._last_render = now
+        
+        surface.blit(own, self.rect.topleft)
+    
+    def _create_surfaces(self):
+        """Allocate the off-screen strip plus its pre-drawn background and separator."""
+        width, height = self.rect.size
+        convert = pygame.display.get_surface() is not None
+        
+        own = pygame.Surface((width, height))
+        bg = pygame.Surface((width, height))
+        bg.fill(self.bg_color)
+        pygame.draw.line(bg, self.border_color, (0, 0), (width, 0))
+        sep = pygame.Surface((1, max(1, height - 5)))
+        sep.fill(self.separator_color)
+        if convert:
+            own, bg, sep = own.convert(), bg.convert(), sep.convert()
+        
+        self._own_surface = own
+        self._bg_surface = bg
+        self._sep_tile = sep
+    
+    def _draw(self, surface: pygame.Surface):
+        """Draw the full status bar strip in local coordinates."""
+        # Background
+        surface.blit(self._bg_surface, (0, 0))
+        
         # Render progress bar if active
-        if self.show_progress:
+        if self.progress_active:
             self._render_progress_bar(surface)
         
         # Render temporary message if active
@@ -324,23 +572,21 @@ class StatusBar:
     
     def _render_progress_bar(self, surface: pygame.Surface):
         """Render the progress bar."""
-        progress_rect = pygame.Rect(self.rect.x + 10, self.rect.y + 5, 
-                                  self.rect.width - 20, self.rect.height - 10)
+        progress_rect = pygame.Rect(10, 5, self.rect.width - 20, self.rect.height - 10)
         
         # Background
         pygame.draw.rect(surface, (230, 230, 230), progress_rect)
         pygame.draw.rect(surface, (180, 180, 180), progress_rect, 1)
         
         # Progress fill
-        if self.progress_value > 0:
-            fill_width = int(progress_rect.width * self.progress_value)
+        if self._last_pct > 0:
+            fill_width = progress_rect.width * self._last_pct // 100
             fill_rect = pygame.Rect(progress_rect.x, progress_rect.y, fill_width, progress_rect.height)
             pygame.draw.rect(surface, self.progress_color, fill_rect)
         
         # Progress text
         if self.operation_text:
-            progress_text = f"{self.operation_text} ({self.progress_value*100:.0f}%)"
-            text_surface = self.font.render(progress_text, True, self.text_color)
+            text_surface = self._render_text(self._progress_text, self.text_color)
             text_x = progress_rect.centerx - text_surface.get_width() // 2
             text_y = progress_rect.centery - text_surface.get_height() // 2
             surface.blit(text_surface, (text_x, text_y))
@@ -348,33 +594,36 @@ class StatusBar:
     def _render_temporary_message(self, surface: pygame.Surface):
         """Render temporary message."""
         if self.temp_message:
-            text_surface = self.font.render(self.temp_message, True, self.temp_message_color)
-            text_x = self.rect.x + 10
-            text_y = self.rect.centery - text_surface.get_height() // 2
+            text_surface = self._render_text(self.temp_message, self.temp_message_color)
+            text_x = 10
+            text_y = (self.rect.height - text_surface.get_height()) // 2
             surface.blit(text_surface, (text_x, text_y))
     
     def _render_sections(self, surface: pygame.Surface):
         """Render all status sections."""
-        for i, section in enumerate(self.sections.values()):
-            if section.visible and section.text:
-                # Highlight clickable sections on hover
-                if section.clickable:
-                    mouse_pos = pygame.mouse.get_pos()
-                    if section.rect.collidepoint(mouse_pos):
-                        pygame.draw.rect(surface, self.highlight_color, section.rect)
-                
-                # Render text
-                text_surface = self.font.render(section.text, True, self.text_color)
-                text_x = section.rect.x + 5
-                text_y = section.rect.centery - text_surface.get_height() // 2
-                surface.blit(text_surface, (text_x, text_y))
-                
-                # Draw separator (except for last section)
-                if i < len(self.sections) - 1 and section.rect.right < self.rect.width - 100:
-                    separator_x = section.rect.right + 5
-                    pygame.draw.line(surface, self.separator_color,
-                                   (separator_x, self.rect.y + 3),
-                                   (separator_x, self.rect.bottom - 3))
+        offset_x, offset_y = -self.rect.x, -self.rect.y
+        visible = self._visible_sections
+        last = len(visible) - 1
+        blits = self._blits_scratch
+        blits.clear()
+        for i, section in enumerate(visible):
+            section_rect = section.rect.move(offset_x, offset_y)
+            
+            # Highlight clickable sections on hover
+            if section is self._hover_section:
+                pygame.draw.rect(surface, self.highlight_color, section_rect)
+            
+            # Render text
+            text_surface = self._render_text(section.text, self.text_color)
+            text_x = section_rect.x + 5
+            text_y = section_rect.centery - text_surface.get_height() // 2
+            blits.append((text_surface, (text_x, text_y)))
+            
+            # Draw separator (except for last section)
+            if i < last and section.rect.right < self.rect.width - 100:
+                blits.append((self._sep_tile, (section_rect.right + 5, 3)))
+        
+        surface.blits(blits, False)
     
     def show_mouse_pos(self, pos: Tuple[int, int]):
         """Update mouse position (for backward compatibility)."""
@@ -382,228 +631,4 @@ class StatusBar:
     
     def set_main_status(self, text: str):
         """Set the main status text."""
-        self.sections["main"].set_text(text)
-        
-        # Sections
-        self.sections: Dict[str, Any] = {}
-    
-    def set_sprite_sheet_info(self, name: str, tile_count: int, dimensions: Tuple[int, int] = None):
-        """Set sprite sheet information."""
-        self.sprite_sheet_name = name
-        self.tile_count = tile_count
-        
-        if dimensions:
-            info_text = f"Sheet: {name} ({tile_count} tiles, {dimensions[0]}x{dimensions[1]})"
-        else:
-            info_text = f"Sheet: {name} ({tile_count} tiles)"
-        
-        if "sheet" in self.sections:
-            self.sections["sheet"].set_text(info_text)
-    
-    def set_selection_info(self, selected_count: int, total_frames: int = None):
-        """Set frame selection information."""
-        self.selected_count = selected_count
-        self.total_frames = total_frames
-        
-        if total_frames:
-            percentage = (selected_count / total_frames) * 100 if total_frames > 0 else 0
-            selection_text = f"Selection: {selected_count}/{total_frames} ({percentage:.1f}%)"
-        else:
-            selection_text = f"Selection: {selected_count} frames"
-        
-        if "selection" in self.sections:
-            self.sections["selection"].set_text(selection_text)
-    
-    def set_mouse_info(self, mouse_pos: Tuple[int, int], frame_pos: Tuple[int, int] = None, 
-                       frame_index: int = None):
-        """Set mouse position and current frame information."""
-        self.mouse_pos = mouse_pos
-        self.frame_pos = frame_pos
-        self.frame_index = frame_index
-        
-        if frame_pos is not None:
-            if frame_index is not None:
-                text = f"Mouse: ({mouse_pos[0]}, {mouse_pos[1]}) | Frame: ({frame_pos[0]}, {frame_pos[1]}) #{frame_index}"
-            else:
-                text = f"Mouse: ({mouse_pos[0]}, {mouse_pos[1]}) | Frame: ({frame_pos[0]}, {frame_pos[1]})"
-        else:
-            text = f"Mouse: ({mouse_pos[0]}, {mouse_pos[1]})"
-        
-        if "mouse" in self.sections:
-            self.sections["mouse"].set_text(text)
-    
-    def show_temporary_message(self, message: str, duration: float = 3.0):
-        """Show a temporary message."""
-        self.temp_message = message
-        self.temp_message_time = time.time()
-        self.temp_message_duration = duration
-    
-    def set_operation_progress(self, operation: str, progress: float):
-        """Set operation progress (0.0 to 1.0)."""
-        self.operation_text = operation
-        self.progress_value = max(0.0, min(1.0, progress))
-        self.show_progress = True
-        
-        # Auto-hide when complete
-        if progress >= 1.0:
-            self.show_temporary_message(f"{operation} completed")
-            # Hide progress after a short delay
-            pygame.time.set_timer(pygame.USEREVENT + 1, 500)  # Hide after 500ms
-    
-    def hide_progress(self):
-        """Hide the progress indicator."""
-        self.show_progress = False
-        self.operation_text = ""
-        self.progress_value = 0.0
-    
-    def set_memory_usage(self, mb: float):
-        """Set memory usage in MB."""
-        self.memory_usage_mb = mb
-    
-    def update(self):
-        """Update the status bar (call each frame)."""
-        # Clear expired temporary messages
-        if self.temp_message and time.time() - self.temp_message_time > self.temp_message_duration:
-            self.temp_message = ""
-    
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        """Handle events for the status bar."""
-        if event.type == pygame.USEREVENT + 1:
-            # Hide progress indicator
-            self.hide_progress()
-            return True
-        return False
-    
-    def render(self, surface: pygame.Surface, window_width: int, y_position: int):
-        """Render the status bar."""
-        # Create status bar rectangle
-        status_rect = pygame.Rect(0, y_position, window_width, self.height)
-        
-        # Draw background
-        pygame.draw.rect(surface, self.bg_color, status_rect)
-        pygame.draw.line(surface, self.border_color, 
-                        (0, y_position), (window_width, y_position))
-        
-        # Update status
-        self.update()
-        
-        # Left section: Sprite sheet info
-        left_text = self._build_left_text()
-        if left_text:
-            left_surface = self.font.render(left_text, True, self.text_color)
-            surface.blit(left_surface, (8, y_position + 6))
-        
-        # Center section: Temporary messages or operation progress
-        center_text = self._get_center_content()
-        if center_text:
-            center_surface = self.font.render(center_text, True, self.text_color)
-            center_x = (window_width - center_surface.get_width()) // 2
-            surface.blit(center_surface, (center_x, y_position + 6))
-        
-        # Progress bar if active
-        if self.show_progress:
-            self._render_progress_bar(surface, window_width, y_position)
-        
-        # Right section: Mouse info and memory usage
-        right_text = self._build_right_text()
-        if right_text:
-            right_surface = self.font.render(right_text, True, self.text_color)
-            right_x = window_width - right_surface.get_width() - 8
-            surface.blit(right_surface, (right_x, y_position + 6))
-    
-    def _build_left_text(self) -> str:
-        """Build the left section text."""
-        parts = []
-        
-        if self.sprite_sheet_name:
-            parts.append(f"Sheet: {self.sprite_sheet_name}")
-        
-        if self.tile_count > 0:
-            parts.append(f"{self.tile_count} tiles")
-        
-        if self.selected_count > 0:
-            parts.append(f"{self.selected_count} selected")
-        
-        return " • ".join(parts)
-    
-    def _get_center_content(self) -> str:
-        """Get the center content text."""
-        if self.temp_message:
-            return self.temp_message
-        elif self.show_progress and self.operation_text:
-            progress_percent = int(self.progress_value * 100)
-            return f"{self.operation_text}... {progress_percent}%"
-        return ""
-    
-    def _build_right_text(self) -> str:
-        """Build the right section text."""
-        parts = []
-        
-        # Mouse position and frame info
-        if self.current_frame_info:
-            parts.append(self.current_frame_info)
-        elif self.mouse_pos != (0, 0):
-            parts.append(f"({self.mouse_pos[0]}, {self.mouse_pos[1]})")
-        
-        # Memory usage if significant
-        if self.memory_usage_mb > 50:  # Only show if using more than 50MB
-            parts.append(f"{self.memory_usage_mb:.1f}MB")
-        
-        return " • ".join(parts)
-    
-    def _render_progress_bar(self, surface: pygame.Surface, window_width: int, y_position: int):
-        """Render the progress bar."""
-        if not self.show_progress:
-            return
-        
-        # Progress bar dimensions
-        bar_width = 200
-        bar_height = 6
-        bar_x = (window_width - bar_width) // 2
-        bar_y = y_position + self.height - bar_height - 3
-        
-        # Background
-        bg_rect = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(surface, self.progress_bg_color, bg_rect)
-        pygame.draw.rect(surface, self.border_color, bg_rect, 1)
-        
-        # Fill
-        if self.progress_value > 0:
-            fill_width = int(bar_width * self.progress_value)
-            fill_rect = pygame.Rect(bar_x, bar_y, fill_width, bar_height)
-            pygame.draw.rect(surface, self.progress_fill_color, fill_rect)
-    
-    # Convenience methods for common operations
-    def show_loading(self, operation: str):
-        """Show a loading message."""
-        self.set_operation_progress(operation, 0.0)
-    
-    def update_loading(self, progress: float):
-        """Update loading progress."""
-        if self.show_progress:
-            self.progress_value = max(0.0, min(1.0, progress))
-    
-    def show_success(self, message: str):
-        """Show a success message."""
-        self.hide_progress()
-        self.show_temporary_message(f"✓ {message}")
-    
-    def show_error(self, message: str):
-        """Show an error message."""
-        self.hide_progress()
-        self.show_temporary_message(f"✗ {message}", duration=5.0)
-    
-    def show_info(self, message: str):
-        """Show an info message."""
-        self.show_temporary_message(f"ℹ {message}")
-    
-    def clear_all(self):
-        """Clear all status information."""
-        self.sprite_sheet_name = ""
-        self.tile_count = 0
-        self.selected_count = 0
-        self.mouse_pos = (0, 0)
-        self.current_frame_info = ""
-        self.temp_message = ""
-        self.hide_progress()
-        self.memory_usage_mb = 0
+        self.sections.main.set_text(text)
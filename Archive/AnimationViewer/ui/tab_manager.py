@@ -10,13 +10,62 @@ Author: AI Assistant
 Project: Sprite Animation Tool - Phase 2
 """
 
+import functools
 import os
 import pygame
-from typing import List, Optional, Tuple, Dict
-from dataclasses import dataclass
+from bisect import bisect_right
+from itertools import accumulate
+from collections import OrderedDict
+from typing import List, Optional, Tuple, Dict, Iterator
+from dataclasses import dataclass, field
+from pathlib import PurePath
 
+try:
+    import pygame.freetype as freetype
+except ImportError:  # pragma: no cover - freetype is an optional pygame module
+    freetype = None
 
-@dataclass
+
+# Maximum number of rendered tab labels kept by TabManager._get_label
+_LABEL_CACHE_MAX = 64
+
+
+# Label font description: (backend, name, size, bold), backend being
+# 'freetype', 'font' (pygame.font.Font) or 'sysfont' (pygame.font.SysFont)
+_FontKey = Tuple[str, Optional[str], int, bool]
+
+
+@functools.lru_cache(maxsize=8)
+def _load_label_font(backend: str, name: Optional[str], size: int, bold: bool):
+    """Load a label font once per description, shared across all tab managers."""
+    if backend == 'freetype':
+        font = freetype.Font(name, size)
+        # Pad to the full line height so labels share one baseline
+        font.pad = True
+        return font
+    if backend == 'sysfont':
+        return pygame.font.SysFont(name, size, bold)
+    return pygame.font.Font(name, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _render_cached(font_key: _FontKey, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render text with a label font, shared across all tab managers."""
+    if font_key[0] == 'freetype':
+        return _load_label_font(*font_key).render(text, color)[0]
+    return _load_label_font(*font_key).render(text, True, color)
+
+
+# handle_click result when nothing was hit
+_NO_ACTION = ("none", -1)
+
+
+def _derive_name(spritesheet_path: str) -> str:
+    """Derive a tab display name from a spritesheet path."""
+    return PurePath(spritesheet_path).stem
+
+
+@dataclass(slots=True)
 class SpritesheetTab:
     """Represents a single spritesheet tab."""
     spritesheet_path: str
@@ -24,11 +73,13 @@ class SpritesheetTab:
     spritesheet: Optional[object] = None  # Will hold SpriteSheet object when loaded
     current_animation: Optional[object] = None  # Current AnimationEntry
     is_loaded: bool = False
+    _abs_path: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize derived properties."""
         if not self.name:
-            self.name = os.path.splitext(os.path.basename(self.spritesheet_path))[0]
+            self.name = _derive_name(self.spritesheet_path)
+        self._abs_path = os.path.abspath(self.spritesheet_path)
 
 
 class TabManager:
@@ -44,8 +95,10 @@ class TabManager:
         """
         self.tab_bar_rect = tab_bar_rect
         self.tabs: List[SpritesheetTab] = []
+        self._path_index: Dict[str, int] = {}  # absolute spritesheet path -> tab index
         self.active_tab_index = 0
         self.max_tabs = 8  # Reasonable limit
+        self.verbose = False  # Print add/close/switch messages
         
         # Tab appearance
         self.tab_width = 120
@@ -54,10 +107,23 @@ class TabManager:
         self.close_button_size = 12
         
         # Fonts
+        self._label_font_key: _FontKey = ('font', None, 16, False)
         try:
-            self.font = pygame.font.Font(None, 16)
+            self.font = _load_label_font(*self._label_font_key)
         except pygame.error:
-            self.font = pygame.font.SysFont("Arial", 14)
+            self._label_font_key = ('sysfont', "Arial", 14, False)
+            self.font = _load_label_font(*self._label_font_key)
+        
+        # Labels render through FreeType directly when available (same default
+        # font; pygame.font scales Font(None, 16) to 11pt)
+        self._ft_font = None
+        if freetype is not None:
+            try:
+                freetype.init()
+                self._ft_font = _load_label_font('freetype', None, 11, False)
+                self._label_font_key = ('freetype', None, 11, False)
+            except Exception:
+                self._ft_font = None
         
         # Colors
         self.ACTIVE_TAB_COLOR = (60, 60, 60)
@@ -68,12 +134,41 @@ class TabManager:
         self.CLOSE_BUTTON_COLOR = (180, 180, 180)
         self.CLOSE_BUTTON_HOVER_COLOR = (220, 50, 50)
         self.BACKGROUND_COLOR = (35, 35, 35)
+        self.INACTIVE_TAB_COLOR_HOVER = tuple(min(255, c + 15) for c in self.INACTIVE_TAB_COLOR)
+        
+        # (is_active, is_hovered) -> (fill color, border color); active tabs are not highlighted
+        self._tab_colors = {
+            (True, False): (self.ACTIVE_TAB_COLOR, self.ACTIVE_BORDER_COLOR),
+            (True, True): (self.ACTIVE_TAB_COLOR, self.ACTIVE_BORDER_COLOR),
+            (False, False): (self.INACTIVE_TAB_COLOR, self.INACTIVE_BORDER_COLOR),
+            (False, True): (self.INACTIVE_TAB_COLOR_HOVER, self.INACTIVE_BORDER_COLOR),
+        }
+        
+        # Pre-rendered close button X (normal and hover)
+        self._build_close_surfaces()
+        
+        # Glyph widths used for label truncation
+        self._char_width_cache: Dict[str, int] = {}
+        
+        # Rendered labels keyed by (name, max_width) -> (truncated text, surface)
+        self._text_cache: "OrderedDict[Tuple[str, int], Tuple[str, pygame.Surface]]" = OrderedDict()
+        
+        # handle_click action verbs -> handlers
+        self._dispatch = {"switch_tab": self.switch_to_tab, "close_tab": self.close_tab}
         
         # Interactive tracking
         self.hovered_tab: Optional[int] = None
         self.hovered_close_button: Optional[int] = None
         
-        # Tab positioning
+        # Cached tab bar surface, repainted only when _dirty
+        self._bar_surface: Optional[pygame.Surface] = None
+        self._dirty = True
+        
+        # Tab positioning (rects rebuilt by _update_tab_layout)
+        self._tab_rects: List[pygame.Rect] = []
+        self._close_rects: List[pygame.Rect] = []
+        self._text_x: List[int] = []
+        self._text_max_width = 0
         self._update_tab_layout()
     
     def add_tab(self, spritesheet_path: str, name: str = None) -> int:
@@ -90,6 +185,7 @@ class TabManager:
         existing_tab = self.find_tab_by_spritesheet(spritesheet_path)
         if existing_tab >= 0:
             self.active_tab_index = existing_tab
+            self._dirty = True
             return existing_tab
         
         # Check max tabs limit
@@ -98,15 +194,17 @@ class TabManager:
             return -1
         
         # Create new tab
-        tab_name = name or os.path.splitext(os.path.basename(spritesheet_path))[0]
+        tab_name = name or _derive_name(spritesheet_path)
         new_tab = SpritesheetTab(spritesheet_path, tab_name)
         self.tabs.append(new_tab)
         self.active_tab_index = len(self.tabs) - 1
+        self._path_index[new_tab._abs_path] = self.active_tab_index
         
         # Update layout
         self._update_tab_layout()
         
-        print(f"Added new tab: {tab_name}")
+        if self.verbose:
+            print(f"Added new tab: {tab_name}")
         return self.active_tab_index
     
     def close_tab(self, tab_index: int) -> bool:
@@ -128,7 +226,10 @@ class TabManager:
         
         # Remove the tab
         closed_tab = self.tabs.pop(tab_index)
-        print(f"Closed tab: {closed_tab.name}")
+        self._path_index = {tab._abs_path: i for i, tab in enumerate(self.tabs)}
+        if self.verbose:
+            print(f"Closed tab: {closed_tab.name}")
+        self._invalidate_label(closed_tab.name)
         
         # Adjust active tab index
         if self.active_tab_index >= tab_index and self.active_tab_index > 0:
@@ -163,7 +264,9 @@ class TabManager:
         """
         if 0 <= tab_index < len(self.tabs):
             self.active_tab_index = tab_index
-            print(f"Switched to tab: {self.tabs[tab_index].name}")
+            self._dirty = True
+            if self.verbose:
+                print(f"Switched to tab: {self.tabs[tab_index].name}")
             return True
         return False
     
@@ -176,11 +279,7 @@ class TabManager:
         Returns:
             Tab index if found, -1 if not found
         """
-        abs_path = os.path.abspath(spritesheet_path)
-        for i, tab in enumerate(self.tabs):
-            if os.path.abspath(tab.spritesheet_path) == abs_path:
-                return i
-        return -1
+        return self._path_index.get(os.path.abspath(spritesheet_path), -1)
     
     def get_active_tab(self) -> Optional[SpritesheetTab]:
         """Get the currently active tab.
@@ -198,51 +297,65 @@ class TabManager:
 
     def set_bar_rect(self, rect: pygame.Rect):
         """Update the tab bar rectangle (used when panels are resized)."""
-        self.tab_bar_rect = rect
+        if rect == self.tab_bar_rect:
+            return  # Layout broadcasts often repeat the same rect
+        self.tab_bar_rect = pygame.Rect(rect)  # Own copy so in-place edits by the caller are detected
+        self._text_cache.clear()
         self._update_tab_layout()
     
     def render_tabs(self, surface: pygame.Surface):
         """Render tab bar with clickable tabs."""
-        # Clear background
-        pygame.draw.rect(surface, self.BACKGROUND_COLOR, self.tab_bar_rect)
+        bar = self._bar_surface
+        if bar is None or bar.get_size() != self.tab_bar_rect.size:
+            bar = self._bar_surface = pygame.Surface(self.tab_bar_rect.size)
+            self._dirty = True
+        
+        # Repaint only when tabs, the active tab or hover state changed
+        if self._dirty:
+            self._repaint_bar_surface(bar)
+            self._dirty = False
         
-        # Render each tab
+        surface.blit(bar, self.tab_bar_rect.topleft)
+    
+    def _repaint_bar_surface(self, surface: pygame.Surface):
+        """Draw the whole tab bar into its cached surface (local coordinates)."""
+        # Clear background
+        surface.fill(self.BACKGROUND_COLOR)
+        offset_x, offset_y = -self.tab_bar_rect.x, -self.tab_bar_rect.y
+        
+        # Fill/border each tab, collecting label and close button blits for one batch
+        blits = []
+        show_close = len(self.tabs) > 1
+        text_x = self._text_x
+        text_max_width = self._text_max_width
+        bar_right = self.tab_bar_rect.right
         for i, tab in enumerate(self.tabs):
-            tab_rect = self.get_tab_rect(i)
-            is_active = (i == self.active_tab_index)
-            is_hovered = (self.hovered_tab == i)
+            # Tabs are laid out left to right, so the rest are past the bar's edge
+            if self._tab_rects[i].x >= bar_right:
+                break
+            tab_rect = self._tab_rects[i].move(offset_x, offset_y)
             
-            # Tab background
-            if is_active:
-                tab_color = self.ACTIVE_TAB_COLOR
-                border_color = self.ACTIVE_BORDER_COLOR
-            else:
-                tab_color = self.INACTIVE_TAB_COLOR
-                border_color = self.INACTIVE_BORDER_COLOR
-            
-            # Slight highlight for hover
-            if is_hovered and not is_active:
-                tab_color = tuple(min(255, c + 15) for c in tab_color)
+            # Tab background, with a slight highlight for hovered inactive tabs
+            tab_color, border_color = self._tab_colors[(i == self.active_tab_index, self.hovered_tab == i)]
             
-            # Draw tab background
-            pygame.draw.rect(surface, tab_color, tab_rect)
+            # Draw tab background (fill is cheaper than a filled draw.rect)
+            surface.fill(tab_color, tab_rect)
             pygame.draw.rect(surface, border_color, tab_rect, 1)
             
             # Tab text (truncated if necessary)
-            text_rect = pygame.Rect(tab_rect.x + 8, tab_rect.y, 
-                                   tab_rect.width - 20, tab_rect.height)
-            tab_text = self._truncate_text(tab.name, text_rect.width)
-            text_surface = self.font.render(tab_text, True, self.TEXT_COLOR)
+            text_surface = self._get_label(tab.name, text_max_width)
             text_y = tab_rect.y + (tab_rect.height - text_surface.get_height()) // 2
-            surface.blit(text_surface, (text_rect.x, text_y))
+            blits.append((text_surface, (text_x[i], text_y)))
             
             # Close button (small X) - only show if more than one tab
-            if len(self.tabs) > 1:
-                close_rect = self.get_close_button_rect(i)
-                close_color = (self.CLOSE_BUTTON_HOVER_COLOR 
-                             if self.hovered_close_button == i 
-                             else self.CLOSE_BUTTON_COLOR)
-                self._draw_close_button(surface, close_rect, close_color)
+            if show_close:
+                close_rect = self._close_rects[i]
+                close_surf = (self._close_surf_hover
+                              if self.hovered_close_button == i
+                              else self._close_surf)
+                blits.append((close_surf, (close_rect.x + offset_x, close_rect.y + offset_y)))
+        
+        surface.blits(blits, False)
     
     def get_tab_rect(self, tab_index: int) -> pygame.Rect:
         """Get the rectangle for a specific tab.
@@ -253,12 +366,9 @@ class TabManager:
         Returns:
             Rectangle for the tab
         """
-        if not (0 <= tab_index < len(self.tabs)):
+        if not (0 <= tab_index < len(self._tab_rects)):
             return pygame.Rect(0, 0, 0, 0)
-        
-        x = self.tab_bar_rect.x + tab_index * (self.tab_width + self.tab_spacing)
-        y = self.tab_bar_rect.y
-        return pygame.Rect(x, y, self.tab_width, self.tab_height)
+        return self._tab_rects[tab_index]
     
     def get_close_button_rect(self, tab_index: int) -> pygame.Rect:
         """Get the rectangle for a tab's close button.
@@ -269,37 +379,53 @@ class TabManager:
         Returns:
             Rectangle for the close button
         """
-        tab_rect = self.get_tab_rect(tab_index)
-        close_x = tab_rect.right - self.close_button_size - 4
-        close_y = tab_rect.y + (tab_rect.height - self.close_button_size) // 2
-        return pygame.Rect(close_x, close_y, self.close_button_size, self.close_button_size)
+        if not (0 <= tab_index < len(self._close_rects)):
+            return pygame.Rect(0, 0, 0, 0)
+        return self._close_rects[tab_index]
     
-    def handle_click(self, pos: Tuple[int, int]) -> str:
+    def handle_click(self, pos: Tuple[int, int]) -> Tuple[str, int]:
         """Handle mouse clicks in the tab bar.
         
         Args:
             pos: Mouse position (x, y)
             
         Returns:
-            Action string: "switch_tab:index", "close_tab:index", or "none"
+            Action tuple: ("switch_tab", index), ("close_tab", index), or ("none", -1)
         """
-        if not self.tab_bar_rect.collidepoint(pos):
-            return "none"
-        
-        # Check close buttons first (they have priority)
-        for i in range(len(self.tabs)):
-            if len(self.tabs) > 1:  # Only check if close buttons are visible
-                close_rect = self.get_close_button_rect(i)
-                if close_rect.collidepoint(pos):
-                    return f"close_tab:{i}"
+        tab_index, on_close = self._hit_test(pos)
+        if tab_index < 0:
+            return _NO_ACTION
+        # Close buttons have priority over the tab itself
+        if on_close:
+            return ("close_tab", tab_index)
+        return ("switch_tab", tab_index)
+    
+    def _hit_test(self, pos: Tuple[int, int]) -> Tuple[int, bool]:
+        """Find the tab under a position.
         
-        # Check tab clicks
-        for i in range(len(self.tabs)):
-            tab_rect = self.get_tab_rect(i)
-            if tab_rect.collidepoint(pos):
-                return f"switch_tab:{i}"
+        Tabs form a uniform horizontal strip, so the candidate index is
+        derived from the x offset and only that tab is tested.
         
-        return "none"
+        Args:
+            pos: Mouse position (x, y)
+            
+        Returns:
+            (tab index or -1, whether the position is on its close button)
+        """
+        if not self.tab_bar_rect.collidepoint(pos):
+            return -1, False
+        
+        rel_x = pos[0] - self.tab_bar_rect.x
+        stride = self.tab_width + self.tab_spacing
+        i = rel_x // stride
+        if not (0 <= i < len(self._tab_rects)) or rel_x - i * stride >= self.tab_width:
+            return -1, False  # Past the last tab or in the spacing gap
+        
+        if len(self.tabs) > 1 and self._close_rects[i].collidepoint(pos):  # Close buttons visible
+            return i, True
+        if self._tab_rects[i].collidepoint(pos):
+            return i, False
+        return -1, False
     
     def handle_mouse_motion(self, pos: Tuple[int, int]):
         """Handle mouse motion for hover effects.
@@ -307,50 +433,38 @@ class TabManager:
         Args:
             pos: Mouse position (x, y)
         """
-        if not self.tab_bar_rect.collidepoint(pos):
-            self.hovered_tab = None
-            self.hovered_close_button = None
-            return
-        
-        # Check close button hovers
-        self.hovered_close_button = None
-        for i in range(len(self.tabs)):
-            if len(self.tabs) > 1:  # Only check if close buttons are visible
-                close_rect = self.get_close_button_rect(i)
-                if close_rect.collidepoint(pos):
-                    self.hovered_close_button = i
-                    self.hovered_tab = i  # Tab is also hovered
-                    return
-        
-        # Check tab hovers
-        self.hovered_tab = None
-        for i in range(len(self.tabs)):
-            tab_rect = self.get_tab_rect(i)
-            if tab_rect.collidepoint(pos):
-                self.hovered_tab = i
-                return
-    
-    def process_action(self, action: str) -> bool:
+        tab_index, on_close = self._hit_test(pos)
+        hovered_tab = tab_index if tab_index >= 0 else None  # Tab is also hovered over its close button
+        hovered_close = tab_index if on_close else None
+        if hovered_tab != self.hovered_tab or hovered_close != self.hovered_close_button:
+            self.hovered_tab = hovered_tab
+            self.hovered_close_button = hovered_close
+            self._dirty = True
+    
+    def process_action(self, action) -> bool:
         """Process an action returned from handle_click.
         
         Args:
-            action: Action string from handle_click
+            action: Action tuple from handle_click (legacy "verb:index" strings
+                are still accepted)
             
         Returns:
             True if action was processed, False otherwise
         """
-        if action.startswith("switch_tab:"):
-            tab_index = int(action[11:])  # Remove "switch_tab:" prefix
-            return self.switch_to_tab(tab_index)
-        
-        elif action.startswith("close_tab:"):
-            tab_index = int(action[10:])  # Remove "close_tab:" prefix
-            return self.close_tab(tab_index)
-        
-        return False
+        if isinstance(action, str):
+            verb, _, index = action.partition(":")
+            if not index.isdigit():
+                return False
+            action = (verb, int(index))
+        
+        verb, tab_index = action
+        handler = self._dispatch.get(verb)
+        return handler(tab_index) if handler else False
     
     def _update_tab_layout(self):
         """Update tab layout calculations."""
+        self._dirty = True
+        
         # Calculate available width
         available_width = self.tab_bar_rect.width
         
@@ -359,6 +473,51 @@ class TabManager:
             total_spacing = (len(self.tabs) - 1) * self.tab_spacing
             max_tab_width = (available_width - total_spacing) // len(self.tabs)
             self.tab_width = min(120, max(80, max_tab_width))  # Between 80-120 pixels
+        
+        # Precompute tab and close button rects
+        stride = self.tab_width + self.tab_spacing
+        bar_x, bar_y = self.tab_bar_rect.x, self.tab_bar_rect.y
+        close_size = self.close_button_size
+        close_y = bar_y + (self.tab_height - close_size) // 2
+        self._tab_rects = [pygame.Rect(bar_x + i * stride, bar_y, self.tab_width, self.tab_height)
+                           for i in range(len(self.tabs))]
+        self._close_rects = [pygame.Rect(rect.right - close_size - 4, close_y, close_size, close_size)
+                             for rect in self._tab_rects]
+        
+        # Label placement in bar-local coordinates
+        self._text_x = [i * stride + 8 for i in range(len(self.tabs))]
+        self._text_max_width = self.tab_width - 20
+    
+    def _get_label(self, name: str, max_width: int) -> pygame.Surface:
+        """Get the rendered (and truncated) label surface for a tab name.
+        
+        Args:
+            name: Tab name
+            max_width: Maximum label width in pixels
+            
+        Returns:
+            Cached label surface
+        """
+        key = (name, max_width)
+        entry = self._text_cache.get(key)
+        if entry is None:
+            tab_text = self._truncate_text(name, max_width)
+            entry = (tab_text, self._render_text(tab_text))
+            self._text_cache[key] = entry
+            if len(self._text_cache) > _LABEL_CACHE_MAX:
+                self._text_cache.popitem(last=False)
+        else:
+            self._text_cache.move_to_end(key)
+        return entry[1]
+    
+    def _render_text(self, text: str) -> pygame.Surface:
+        """Render label text with the fastest available font backend."""
+        return _render_cached(self._label_font_key, text, self.TEXT_COLOR)
+    
+    def _invalidate_label(self, name: str):
+        """Drop cached labels for a tab name."""
+        for key in [key for key in self._text_cache if key[0] == name]:
+            del self._text_cache[key]
     
     def _truncate_text(self, text: str, max_width: int) -> str:
         """Truncate text to fit within specified width.
@@ -370,31 +529,42 @@ class TabManager:
         Returns:
             Truncated text with ellipsis if needed
         """
-        # Quick check if text fits
-        text_surface = self.font.render(text, True, self.TEXT_COLOR)
-        if text_surface.get_width() <= max_width:
+        # Cumulative glyph widths; the cutoff is found by bisecting the prefix sums
+        prefix = list(accumulate(self._char_width(c) for c in text))
+        if not prefix or prefix[-1] <= max_width:
             return text
         
-        # Binary search for best fit
-        left, right = 0, len(text)
-        best_text = ""
-        
-        while left <= right:
-            mid = (left + right) // 2
-            test_text = text[:mid] + ("..." if mid < len(text) else "")
-            test_surface = self.font.render(test_text, True, self.TEXT_COLOR)
-            
-            if test_surface.get_width() <= max_width:
-                best_text = test_text
-                left = mid + 1
+        ellipsis_width = self._char_width("...")
+        if ellipsis_width > max_width:
+            return ""
+        return text[:bisect_right(prefix, max_width - ellipsis_width)] + "..."
+    
+    def _char_width(self, text: str) -> int:
+        """Get the memoized pixel width of a character (or short string)."""
+        width = self._char_width_cache.get(text)
+        if width is None:
+            if self._ft_font is not None:
+                # Sum glyph advances; get_rect() reports ink bounds and is 0 for spaces
+                width = round(sum(m[4] for m in self._ft_font.get_metrics(text) if m))
             else:
-                right = mid - 1
-        
-        return best_text
+                width = self.font.size(text)[0]
+            self._char_width_cache[text] = width
+        return width
+    
+    def _build_close_surfaces(self):
+        """Pre-render the close button X in its normal and hover colors."""
+        size = self.close_button_size
+        rect = pygame.Rect(0, 0, size, size)
+        self._close_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+        self._draw_close_button(self._close_surf, rect, self.CLOSE_BUTTON_COLOR)
+        self._close_surf_hover = pygame.Surface((size, size), pygame.SRCALPHA)
+        self._draw_close_button(self._close_surf_hover, rect, self.CLOSE_BUTTON_HOVER_COLOR)
     
     def _draw_close_button(self, surface: pygame.Surface, rect: pygame.Rect, color: Tuple[int, int, int]):
         """Draw a close button (X) in the specified rectangle.
         
+        Only called by _build_close_surfaces; tabs blit the pre-rendered result.
+        
         Args:
             surface: Surface to draw on
             rect: Rectangle for the close button
@@ -439,17 +609,24 @@ class TabManager:
         Returns:
             List of dictionaries with tab information
         """
-        return [
-            {
+        return list(self.iter_tab_info())
+    
+    def iter_tab_info(self) -> Iterator[Dict[str, any]]:
+        """Iterate over tab information without building a list.
+        
+        Yields:
+            Dictionary with information about each tab
+        """
+        active_index = self.active_tab_index
+        for i, tab in enumerate(self.tabs):
+            yield {
                 "index": i,
                 "name": tab.name,
                 "path": tab.spritesheet_path,
-                "is_active": i == self.active_tab_index,
+                "is_active": i == active_index,
                 "is_loaded": tab.is_loaded,
                 "has_animation": tab.current_animation is not None
             }
-            for i, tab in enumerate(self.tabs)
-        ]
 
 
 # Test function for development
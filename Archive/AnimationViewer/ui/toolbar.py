@@ -5,27 +5,89 @@ Provides quick access to commonly used functions with icon-based buttons.
 
 import pygame
 import os
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
 from typing import Dict, List, Tuple, Optional, Callable
 
+_TOOLTIP_CACHE_MAX = 64
+
+
+def _to_display_format(surface: pygame.Surface, alpha: bool = False) -> pygame.Surface:
+    """Convert a prebuilt surface to the display pixel format once a display exists."""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha() if alpha else surface.convert()
+
+# Serpentine path over the 'grid' icon lines at x/y = 4, 8, 12, 16, 20. The
+# connecting segments run along grid lines, so one polyline draws the grid.
+_GRID_ICON_POINTS = [
+    (4, 4), (4, 20), (8, 20), (8, 4), (12, 4), (12, 20),
+    (16, 20), (16, 4), (20, 4), (20, 20),
+    (4, 20), (4, 16), (20, 16), (20, 12), (4, 12),
+    (4, 8), (20, 8), (20, 4), (4, 4),
+]
+
 class ToolbarButton:
     """Individual toolbar button with icon, tooltip, and callback."""
     
+    # Icon artwork depends only on icon_name, so draw each one once
+    _ICON_CACHE: Dict[str, pygame.Surface] = {}
+    
+    _STATE_COLORS = {
+        'disabled': (240, 240, 240),
+        'active': (200, 200, 255),
+        'hover': (220, 220, 220),
+        'normal': (250, 250, 250),
+    }
+    
     def __init__(self, icon_name: str, tooltip: str, callback: Callable, 
                  shortcut: str = "", enabled: bool = True, toggle: bool = False):
         self.icon_name = icon_name
         self.tooltip = tooltip
         self.callback = callback
         self.shortcut = shortcut
-        self.enabled = enabled
+        self.display_tooltip = f"{tooltip} ({shortcut})" if shortcut else tooltip
         self.toggle = toggle
         self.active = False
         self.hovered = False
         self.rect = pygame.Rect(0, 0, 32, 32)
         self.icon_surface = None
-        self._load_icon()
+        self._enabled = True
+        self._disabled_surface: Optional[pygame.Surface] = None
+        self._state_surfaces: Dict[str, pygame.Surface] = {}
+        self._state_key: Tuple = ()
+        # Icon artwork is loaded on the first render
+        self.enabled = enabled
+    
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+    
+    @enabled.setter
+    def enabled(self, value: bool):
+        """Enable or disable the button, pre-rendering the grayed icon once."""
+        value = bool(value)
+        if value == self._enabled and (value or self._disabled_surface is not None):
+            return
+        self._enabled = value
+        if value or self.icon_surface is None:
+            self._disabled_surface = None
+        else:
+            self._build_disabled_surface()
+    
+    def _build_disabled_surface(self):
+        gray_icon = self.icon_surface.copy()
+        gray_icon.fill((128, 128, 128, 128), special_flags=pygame.BLEND_MULT)
+        self._disabled_surface = gray_icon
     
     def _load_icon(self):
         """Load or create icon surface for the button."""
+        cached = ToolbarButton._ICON_CACHE.get(self.icon_name)
+        if cached is not None:
+            self.icon_surface = cached
+            return
+        
         # Create a larger icon surface for better detail
         self.icon_surface = pygame.Surface((24, 24))
         self.icon_surface.fill((255, 255, 255))  # White background
@@ -73,9 +135,7 @@ class ToolbarButton:
         elif self.icon_name == 'grid':
             # Grid pattern - clear grid lines
             pygame.draw.rect(self.icon_surface, (255, 255, 255), (4, 4, 16, 16))
-            for i in range(4, 21, 4):
-                pygame.draw.line(self.icon_surface, (150, 150, 150), (i, 4), (i, 20), 1)
-                pygame.draw.line(self.icon_surface, (150, 150, 150), (4, i), (20, i), 1)
+            pygame.draw.lines(self.icon_surface, (150, 150, 150), False, _GRID_ICON_POINTS, 1)
             pygame.draw.rect(self.icon_surface, (0, 0, 0), (4, 4, 16, 16), 2)
             
         elif self.icon_name == 'analysis':
@@ -129,16 +189,24 @@ class ToolbarButton:
             # Default icon - question mark
             pygame.draw.circle(self.icon_surface, (200, 200, 200), (12, 12), 10)
             pygame.draw.circle(self.icon_surface, (100, 100, 100), (12, 12), 10, 2)
+        
+        self.icon_surface = _to_display_format(self.icon_surface)
+        ToolbarButton._ICON_CACHE[self.icon_name] = self.icon_surface
     
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        """Handle mouse events for the button."""
+    def handle_event(self, event: pygame.event.Event, hit: Optional[bool] = None) -> bool:
+        """Handle mouse events for the button.
+        
+        ``hit`` lets the toolbar pass an already resolved hit test.
+        """
         if not self.enabled:
             return False
             
+        if hit is None:
+            hit = self.rect.collidepoint(event.pos)
         if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
+            self.hovered = hit
         elif event.type == pygame.MOUSEBUTTONDOWN:
-            if event.button == 1 and self.rect.collidepoint(event.pos):
+            if event.button == 1 and hit:
                 if self.toggle:
                     self.active = not self.active
                 self.callback()
@@ -146,56 +214,87 @@ class ToolbarButton:
         
         return False
     
-    def render(self, surface: pygame.Surface):
-        """Render the toolbar button."""
-        # Button background
+    def _state_name(self) -> str:
         if not self.enabled:
-            bg_color = (240, 240, 240)
-        elif self.active:
-            bg_color = (200, 200, 255)
-        elif self.hovered:
-            bg_color = (220, 220, 220)
-        else:
-            bg_color = (250, 250, 250)
-        
-        pygame.draw.rect(surface, bg_color, self.rect)
-        pygame.draw.rect(surface, (128, 128, 128), self.rect, 1)
+            return 'disabled'
+        if self.active:
+            return 'active'
+        if self.hovered:
+            return 'hover'
+        return 'normal'
+    
+    def _get_state_surface(self, state: str) -> pygame.Surface:
+        """Return the composited button (background, border, icon) for a state."""
+        key = (self.rect.size, self.icon_surface)
+        if key != self._state_key:
+            self._state_surfaces.clear()
+            self._state_key = key
+        cached = self._state_surfaces.get(state)
+        if cached is not None:
+            return cached
         
-        # Icon
+        width, height = self.rect.size
+        composite = _to_display_format(pygame.Surface((width, height)))
+        composite.fill(self._STATE_COLORS[state])
+        pygame.draw.rect(composite, (128, 128, 128), composite.get_rect(), 1)
         if self.icon_surface:
-            icon_x = self.rect.x + (self.rect.width - 24) // 2
-            icon_y = self.rect.y + (self.rect.height - 24) // 2
+            icon = self.icon_surface
+            if state == 'disabled' and self._disabled_surface is not None:
+                icon = self._disabled_surface
+            composite.blit(icon, ((width - 24) // 2, (height - 24) // 2))
+        self._state_surfaces[state] = composite
+        return composite
+    
+    def current_surface(self) -> pygame.Surface:
+        """Return the prebuilt surface for the button's current state."""
+        if self.icon_surface is None:
+            self._load_icon()
             if not self.enabled:
-                # Gray out disabled icons
-                gray_icon = self.icon_surface.copy()
-                gray_icon.fill((128, 128, 128, 128), special_flags=pygame.BLEND_MULT)
-                surface.blit(gray_icon, (icon_x, icon_y))
-            else:
-                surface.blit(self.icon_surface, (icon_x, icon_y))
+                self._build_disabled_surface()
+        return self._get_state_surface(self._state_name())
+    
+    def render(self, surface: pygame.Surface):
+        """Render the toolbar button."""
+        surface.blit(self.current_surface(), self.rect)
 
 
 class ToolbarSeparator:
     """Visual separator between toolbar button groups."""
     
+    # Transparent surfaces holding just the separator line, keyed by size
+    _SURFACE_CACHE: Dict[Tuple[int, int], pygame.Surface] = {}
+    
     def __init__(self):
         self.rect = pygame.Rect(0, 0, 8, 32)
     
+    def current_surface(self) -> pygame.Surface:
+        """Return the prebuilt separator line surface."""
+        size = self.rect.size
+        cached = ToolbarSeparator._SURFACE_CACHE.get(size)
+        if cached is None:
+            width, height = size
+            cached = pygame.Surface(size, pygame.SRCALPHA)
+            pygame.draw.line(cached, (180, 180, 180),
+                             (width // 2, 4), (width // 2, height - 4))
+            cached = _to_display_format(cached, alpha=True)
+            ToolbarSeparator._SURFACE_CACHE[size] = cached
+        return cached
+    
     def render(self, surface: pygame.Surface):
         """Render the separator line."""
-        line_x = self.rect.x + self.rect.width // 2
-        pygame.draw.line(surface, (180, 180, 180), 
-                        (line_x, self.rect.y + 4), 
-                        (line_x, self.rect.bottom - 4))
+        surface.blit(self.current_surface(), self.rect)
 
 
 class Toolbar:
     """Main toolbar with grouped buttons and separators."""
     
+    # Event types handle_event reacts to; callers may filter on this
+    HANDLED_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN)
+    
     def __init__(self, height: int = 40):
         self.height = height
         self.rect = pygame.Rect(0, 0, 0, height)
-        self.buttons: List[ToolbarButton] = []
-        self.separators: List[ToolbarSeparator] = []
+        self._buttons_by_name: Dict[str, ToolbarButton] = {}
         self.items: List = []  # Mixed list of buttons and separators
         self.background_color = (245, 245, 245)
         self.font = pygame.font.Font(None, 14)
@@ -204,84 +303,152 @@ class Toolbar:
         self.tooltip_pos = (0, 0)
         self.tooltip_timer = 0
         self.tooltip_delay = 500  # milliseconds
+        self._x_starts: List[int] = []
+        self._extents: List[Tuple[int, int, int]] = []  # (right, top, bottom)
+        self._hit_items: List[Optional[ToolbarButton]] = []
+        self._next_x = 8  # Start padding
+        self._hover_button: Optional[ToolbarButton] = None
+        self._last_mouse_pos: Optional[Tuple[int, int]] = None
+        self._polled = False
+        self._bg_surface: Optional[pygame.Surface] = None
+        self._tooltip_cache: "OrderedDict[str, pygame.Surface]" = OrderedDict()
         
     def add_button(self, icon_name: str, tooltip: str, callback: Callable,
                    shortcut: str = "", enabled: bool = True, toggle: bool = False) -> ToolbarButton:
         """Add a button to the toolbar."""
         button = ToolbarButton(icon_name, tooltip, callback, shortcut, enabled, toggle)
-        self.buttons.append(button)
-        self.items.append(button)
-        self._update_layout()
+        self._buttons_by_name.setdefault(icon_name, button)
+        self._append_item(button)
         return button
     
     def add_separator(self):
         """Add a visual separator to the toolbar."""
         separator = ToolbarSeparator()
-        self.separators.append(separator)
-        self.items.append(separator)
-        self._update_layout()
+        self._append_item(separator)
     
     def _update_layout(self):
         """Update the layout of toolbar items."""
-        x = 8  # Start padding
-        for item in self.items:
-            item.rect.x = x
-            item.rect.y = (self.height - item.rect.height) // 2
-            x += item.rect.width + 2
+        items = self.items
+        height = self.height
+        steps = [item.rect.width + 2 for item in items]
+        starts = list(accumulate(steps, initial=8))
+        self._next_x = starts.pop()
+        for item, x in zip(items, starts):
+            item.rect.topleft = (x, (height - item.rect.height) // 2)
+        self._x_starts = starts
+        self._extents = [(item.rect.right, item.rect.top, item.rect.bottom) for item in items]
+        self._hit_items = [item if isinstance(item, ToolbarButton) else None for item in items]
+    
+    def _append_item(self, item):
+        """Place a new item after the last one without re-laying out the rest."""
+        x = self._next_x
+        rect = item.rect
+        rect.topleft = (x, (self.height - rect.height) // 2)
+        self.items.append(item)
+        self._x_starts.append(x)
+        self._extents.append((rect.right, rect.top, rect.bottom))
+        self._hit_items.append(item if isinstance(item, ToolbarButton) else None)
+        self._next_x = x + rect.width + 2
+    
+    def _button_at(self, pos: Tuple[int, int]) -> Optional[ToolbarButton]:
+        """Return the button under pos using the sorted item x offsets."""
+        x, y = pos
+        if not 0 <= y < self.height:
+            return None
+        idx = bisect_right(self._x_starts, x) - 1
+        if idx < 0:
+            return None
+        # Plain int compares against the cached extents instead of Rect lookups
+        right, top, bottom = self._extents[idx]
+        if x < right and top <= y < bottom:
+            return self._hit_items[idx]
+        return None
     
     def set_button_state(self, icon_name: str, enabled: bool = None, active: bool = None):
         """Update button state by icon name."""
-        for button in self.buttons:
-            if button.icon_name == icon_name:
-                if enabled is not None:
-                    button.enabled = enabled
-                if active is not None and button.toggle:
-                    button.active = active
-                break
+        button = self._buttons_by_name.get(icon_name)
+        if button is None:
+            return
+        if enabled is not None:
+            button.enabled = enabled
+        if active is not None and button.toggle:
+            button.active = active
     
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle events for all toolbar items."""
-        # Handle tooltip timing
+        if event.type not in self.HANDLED_EVENTS:
+            return False
         if event.type == pygame.MOUSEMOTION:
-            self.tooltip_timer = pygame.time.get_ticks()
+            # Hover is resolved once per frame when update() is given the mouse position
+            if not self._polled:
+                self._update_hover(event.pos)
+            return False
+        
+        # Only the button under the cursor can react
+        button = self._button_at(event.pos)
+        if button is not None:
+            return button.handle_event(event, True)
+        return False
+    
+    def _update_hover(self, pos: Tuple[int, int]):
+        """Update hovered button and tooltip state for a mouse position."""
+        if pos == self._last_mouse_pos:
+            return
+        self._last_mouse_pos = pos
+        if not 0 <= pos[1] < self.height:
+            # Cursor is off the toolbar: drop hover and tooltip state, skip timing
+            if self._hover_button is not None:
+                self._hover_button.hovered = False
+                self._hover_button = None
+            self.tooltip_text = ""
             self.tooltip_visible = False
-            
-            # Check if hovering over any button
-            for button in self.buttons:
-                if button.rect.collidepoint(event.pos) and button.enabled:
-                    self.tooltip_text = button.tooltip
-                    if button.shortcut:
-                        self.tooltip_text += f" ({button.shortcut})"
-                    self.tooltip_pos = (event.pos[0], event.pos[1] + 20)
-                    break
-            else:
-                self.tooltip_text = ""
+            return
+        button = self._button_at(pos)
         
-        # Handle button events
-        for button in self.buttons:
-            if button.handle_event(event):
-                return True
+        # Handle tooltip timing
+        self.tooltip_timer = pygame.time.get_ticks()
+        self.tooltip_visible = False
         
-        return False
+        if button is not self._hover_button:
+            if self._hover_button is not None:
+                self._hover_button.hovered = False
+            self._hover_button = button
+        
+        if button is not None and button.enabled:
+            button.hovered = True
+            self.tooltip_text = button.display_tooltip
+            self.tooltip_pos = (pos[0], pos[1] + 20)
+        else:
+            self.tooltip_text = ""
     
-    def update(self):
-        """Update toolbar state (tooltips, animations, etc.)."""
+    def update(self, mouse_pos: Optional[Tuple[int, int]] = None):
+        """Update toolbar state (tooltips, animations, etc.).
+        
+        Passing the current mouse position switches hover tracking to once
+        per frame, and MOUSEMOTION events are then ignored by handle_event.
+        """
+        if mouse_pos is not None:
+            self._polled = True
+            self._update_hover(mouse_pos)
+        if not self.tooltip_text or self.tooltip_visible:
+            return
+        # Nobody is looking at the toolbar while the window is unfocused
+        if not pygame.mouse.get_focused():
+            return
         # Show tooltip after delay
-        if (self.tooltip_text and not self.tooltip_visible and 
-            pygame.time.get_ticks() - self.tooltip_timer > self.tooltip_delay):
+        if pygame.time.get_ticks() - self.tooltip_timer > self.tooltip_delay:
             self.tooltip_visible = True
     
     def render(self, surface: pygame.Surface):
         """Render the complete toolbar."""
-        # Background
-        pygame.draw.rect(surface, self.background_color, self.rect)
-        pygame.draw.line(surface, (200, 200, 200), 
-                        (self.rect.left, self.rect.bottom - 1), 
-                        (self.rect.right, self.rect.bottom - 1))
+        # Background strip is pre-rendered and only rebuilt on resize
+        if self._bg_surface is None or self._bg_surface.get_size() != self.rect.size:
+            self._build_background()
+        surface.blit(self._bg_surface, self.rect.topleft)
         
-        # Render all items
-        for item in self.items:
-            item.render(surface)
+        # Every item is a prebuilt surface, so submit them in one blits() call
+        surface.blits([(item.current_surface(), item.rect.topleft) for item in self.items],
+                      doreturn=False)
         
         # Render tooltip
         if self.tooltip_visible and self.tooltip_text:
@@ -292,11 +459,8 @@ class Toolbar:
         if not self.tooltip_text:
             return
             
-        # Create tooltip surface
-        text_surface = self.font.render(self.tooltip_text, True, (0, 0, 0))
-        padding = 4
-        tooltip_width = text_surface.get_width() + padding * 2
-        tooltip_height = text_surface.get_height() + padding * 2
+        tooltip_surface = self._get_tooltip_surface(self.tooltip_text)
+        tooltip_width, tooltip_height = tooltip_surface.get_size()
         
         # Position tooltip (avoid screen edges)
         x, y = self.tooltip_pos
@@ -306,16 +470,46 @@ class Toolbar:
         if y + tooltip_height > screen_rect.bottom:
             y = self.tooltip_pos[1] - tooltip_height - 20
         
-        # Draw tooltip background
         tooltip_rect = pygame.Rect(x, y, tooltip_width, tooltip_height)
-        pygame.draw.rect(surface, (255, 255, 225), tooltip_rect)
-        pygame.draw.rect(surface, (128, 128, 128), tooltip_rect, 1)
+        if not tooltip_rect.colliderect(screen_rect):
+            return
+        surface.blit(tooltip_surface, tooltip_rect)
+    
+    def _get_tooltip_surface(self, text: str) -> pygame.Surface:
+        """Return the tooltip box (background, border, text) through a small LRU cache."""
+        cache = self._tooltip_cache
+        tooltip_surface = cache.get(text)
+        if tooltip_surface is not None:
+            cache.move_to_end(text)
+            return tooltip_surface
         
-        # Draw tooltip text
-        text_x = x + padding
-        text_y = y + padding
-        surface.blit(text_surface, (text_x, text_y))
+        text_surface = self.font.render(text, True, (0, 0, 0))
+        padding = 4
+        tooltip_surface = _to_display_format(pygame.Surface(
+            (text_surface.get_width() + padding * 2, text_surface.get_height() + padding * 2)))
+        tooltip_surface.fill((255, 255, 225))
+        pygame.draw.rect(tooltip_surface, (128, 128, 128), tooltip_surface.get_rect(), 1)
+        tooltip_surface.blit(text_surface, (padding, padding))
+        
+        cache[text] = tooltip_surface
+        if len(cache) > _TOOLTIP_CACHE_MAX:
+            cache.popitem(last=False)
+        return tooltip_surface
+    
+    def set_font(self, font: pygame.font.Font):
+        """Change the tooltip font and drop tooltips rendered with the old one."""
+        self.font = font
+        self._tooltip_cache.clear()
+    
+    def _build_background(self):
+        """Render the background fill and bottom border into a cached surface."""
+        width, height = self.rect.size
+        bg = _to_display_format(pygame.Surface((width, height)))
+        bg.fill(self.background_color)
+        pygame.draw.line(bg, (200, 200, 200), (0, height - 1), (width, height - 1))
+        self._bg_surface = bg
     
     def resize(self, width: int):
         """Update toolbar width."""
         self.rect.width = width
+        self._build_background()
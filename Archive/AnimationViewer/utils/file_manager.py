@@ -2,9 +2,36 @@
 File management utilities for the sprite animation tool.
 """
 import os
+import stat
+import threading
+import time
 import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
 from tkinter import filedialog, messagebox
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Seconds a path validation result is reused before hitting the filesystem
+_STAT_TTL = 1.0
+_STAT_CACHE_MAX = 512
+
+_SPRITE_FILETYPES = (
+    ("Image files", "*.png *.jpg *.jpeg *.bmp *.tiff *.tga"),
+    ("PNG files", "*.png"),
+    ("JPEG files", "*.jpg *.jpeg"),
+    ("All files", "*.*"),
+)
+
+_ANIMATION_FILETYPES = (
+    ("JSON files", "*.json"),
+    ("Python files", "*.py"),
+    ("All files", "*.*"),
+)
+
+_PROJECT_FILETYPES = (
+    ("Project files", "*.sap"),  # Sprite Animation Project
+    ("JSON files", "*.json"),
+    ("All files", "*.*"),
+)
 
 
 class FileManager:
@@ -16,6 +43,12 @@ class FileManager:
         """Initialize file manager."""
         # Initialize tkinter root for dialogs (hidden)
         self._tk_root = None
+        self._tk_lock = threading.RLock()
+        # Single worker thread that owns the Tk root and runs every dialog.
+        # cleanup() must run before exit so the root is destroyed on that thread.
+        # Tk off the main thread is not supported on macOS.
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stat_cache: Dict[Tuple[str, str], Tuple[float, Tuple[bool, str]]] = {}
         self._last_directories = {
             'sprite_sheet': '',
             'animation': '',
@@ -25,54 +58,122 @@ class FileManager:
     
     def _ensure_tk_root(self):
         """Ensure tkinter root exists for dialogs."""
-        if self._tk_root is None:
-            self._tk_root = tk.Tk()
-            self._tk_root.withdraw()  # Hide the root window
-            
-    def open_sprite_sheet_dialog(self, multiple: bool = False) -> Optional[List[str]]:
+        with self._tk_lock:
+            if self._tk_root is None:
+                self._tk_root = tk.Tk()
+                self._tk_root.withdraw()  # Hide the root window
+    
+    def _submit(self, func, *args, **kwargs) -> Future:
+        """Run func on the dialog thread, creating the Tk root there first."""
+        with self._tk_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="file-dialog")
+            executor = self._executor
+        
+        def task():
+            self._ensure_tk_root()
+            return func(*args, **kwargs)
+        
+        return executor.submit(task)
+    
+    def _tk_call(self, func, *args, **kwargs):
+        """Run func on the dialog thread and wait for its result."""
+        return self._submit(func, *args, **kwargs).result()
+    
+    def _messagebox(self, func, title: str, message: str):
+        """Show a messagebox owned by this manager's root (dialog thread only)."""
+        return func(title, message, parent=self._tk_root)
+    
+    def prewarm(self) -> Future:
+        """Create the hidden Tk root on the dialog thread ahead of the first dialog."""
+        return self._submit(lambda: None)
+    
+    def _run_dialog(self, kind: str, key: str, *, title: str, filetypes=None,
+                    initialfile: Optional[str] = None, defaultextension: Optional[str] = None,
+                    multiple: bool = False, initialdir: Optional[str] = None) -> Optional[List[str]]:
         """
-        Open file dialog for sprite sheet selection.
+        Show a native file dialog and remember the directory it ended in.
         
         Args:
-            multiple: Allow multiple file selection
+            kind: 'open', 'save' or 'directory'
+            key: Entry of _last_directories to start from and update
+            initialdir: Start directory overriding the remembered one
             
         Returns:
-            List of selected file paths or None if cancelled
+            List of selected paths or None if cancelled
         """
-        self._ensure_tk_root()
-        
-        filetypes = [
-            ("Image files", "*.png *.jpg *.jpeg *.bmp *.tiff *.tga"),
-            ("PNG files", "*.png"),
-            ("JPEG files", "*.jpg *.jpeg"),
-            ("All files", "*.*")
-        ]
-        
-        initial_dir = self._last_directories.get('sprite_sheet', os.getcwd())
+        initial_dir = initialdir or self._last_directories.get(key, os.getcwd())
         
         try:
-            if multiple:
-                filenames = filedialog.askopenfilenames(
-                    title="Open Sprite Sheet(s)",
+            if kind == 'directory':
+                result = filedialog.askdirectory(
+                    parent=self._tk_root,
+                    title=title,
+                    initialdir=initial_dir
+                )
+            elif kind == 'save':
+                result = filedialog.asksaveasfilename(
+                    parent=self._tk_root,
+                    title=title,
+                    initialdir=initial_dir,
+                    initialfile=initialfile,
+                    filetypes=filetypes,
+                    defaultextension=defaultextension
+                )
+            elif multiple:
+                result = filedialog.askopenfilenames(
+                    parent=self._tk_root,
+                    title=title,
                     initialdir=initial_dir,
                     filetypes=filetypes
                 )
-                if filenames:
-                    self._last_directories['sprite_sheet'] = os.path.dirname(filenames[0])
-                    return list(filenames)
             else:
-                filename = filedialog.askopenfilename(
-                    title="Open Sprite Sheet",
+                result = filedialog.askopenfilename(
+                    parent=self._tk_root,
+                    title=title,
                     initialdir=initial_dir,
                     filetypes=filetypes
                 )
-                if filename:
-                    self._last_directories['sprite_sheet'] = os.path.dirname(filename)
-                    return [filename]
         except Exception as e:
-            print(f"File dialog error: {e}")
+            label = "Directory" if kind == 'directory' else "File"
+            print(f"{label} dialog error: {e}")
+            return None
+        
+        if not result:
+            return None
+        paths = list(result) if isinstance(result, tuple) else [result]
+        self._last_directories[key] = paths[0] if kind == 'directory' else os.path.dirname(paths[0])
+        return paths
+    
+    def open_sprite_sheet_dialog(self, multiple: bool = False) -> Optional[List[str]]:
+        """
+        Open file dialog for sprite sheet selection.
         
-        return None
+        Args:
+            multiple: Allow multiple file selection
+            
+        Returns:
+            List of selected file paths or None if cancelled
+        """
+        return self.open_sprite_sheet_dialog_async(multiple).result()
+    
+    def open_sprite_sheet_dialog_async(self, multiple: bool = False,
+                                       initialdir: Optional[str] = None) -> Future:
+        """
+        Open the sprite sheet dialog without blocking the caller.
+        
+        Args:
+            multiple: Allow multiple file selection
+            initialdir: Start directory overriding the remembered one
+            
+        Returns:
+            Future resolving to the selected file paths or None; poll done()
+            from the main loop to keep rendering while the dialog is open
+        """
+        title = "Open Sprite Sheet(s)" if multiple else "Open Sprite Sheet"
+        return self._submit(self._run_dialog, 'open', 'sprite_sheet', title=title,
+                            filetypes=_SPRITE_FILETYPES, multiple=multiple,
+                            initialdir=initialdir)
     
     def save_animation_dialog(self, default_name: str = "animation") -> Optional[str]:
         """
@@ -84,31 +185,10 @@ class FileManager:
         Returns:
             Selected file path or None if cancelled
         """
-        self._ensure_tk_root()
-        
-        filetypes = [
-            ("JSON files", "*.json"),
-            ("Python files", "*.py"),
-            ("All files", "*.*")
-        ]
-        
-        initial_dir = self._last_directories.get('animation', os.getcwd())
-        
-        try:
-            filename = filedialog.asksaveasfilename(
-                title="Save Animation",
-                initialdir=initial_dir,
-                initialfile=f"{default_name}.json",
-                filetypes=filetypes,
-                defaultextension=".json"
-            )
-            if filename:
-                self._last_directories['animation'] = os.path.dirname(filename)
-                return filename
-        except Exception as e:
-            print(f"File dialog error: {e}")
-        
-        return None
+        paths = self._tk_call(self._run_dialog, 'save', 'animation', title="Save Animation",
+                              filetypes=_ANIMATION_FILETYPES,
+                              initialfile=f"{default_name}.json", defaultextension=".json")
+        return paths[0] if paths else None
     
     def open_project_dialog(self) -> Optional[str]:
         """
@@ -117,29 +197,9 @@ class FileManager:
         Returns:
             Selected project file path or None if cancelled
         """
-        self._ensure_tk_root()
-        
-        filetypes = [
-            ("Project files", "*.sap"),  # Sprite Animation Project
-            ("JSON files", "*.json"),
-            ("All files", "*.*")
-        ]
-        
-        initial_dir = self._last_directories.get('project', os.getcwd())
-        
-        try:
-            filename = filedialog.askopenfilename(
-                title="Open Project",
-                initialdir=initial_dir,
-                filetypes=filetypes
-            )
-            if filename:
-                self._last_directories['project'] = os.path.dirname(filename)
-                return filename
-        except Exception as e:
-            print(f"File dialog error: {e}")
-        
-        return None
+        paths = self._tk_call(self._run_dialog, 'open', 'project', title="Open Project",
+                              filetypes=_PROJECT_FILETYPES)
+        return paths[0] if paths else None
     
     def save_project_dialog(self, default_name: str = "project") -> Optional[str]:
         """
@@ -151,31 +211,10 @@ class FileManager:
         Returns:
             Selected file path or None if cancelled
         """
-        self._ensure_tk_root()
-        
-        filetypes = [
-            ("Project files", "*.sap"),
-            ("JSON files", "*.json"),
-            ("All files", "*.*")
-        ]
-        
-        initial_dir = self._last_directories.get('project', os.getcwd())
-        
-        try:
-            filename = filedialog.asksaveasfilename(
-                title="Save Project",
-                initialdir=initial_dir,
-                initialfile=f"{default_name}.sap",
-                filetypes=filetypes,
-                defaultextension=".sap"
-            )
-            if filename:
-                self._last_directories['project'] = os.path.dirname(filename)
-                return filename
-        except Exception as e:
-            print(f"File dialog error: {e}")
-        
-        return None
+        paths = self._tk_call(self._run_dialog, 'save', 'project', title="Save Project",
+                              filetypes=_PROJECT_FILETYPES,
+                              initialfile=f"{default_name}.sap", defaultextension=".sap")
+        return paths[0] if paths else None
     
     def choose_export_directory(self) -> Optional[str]:
         """
@@ -184,22 +223,8 @@ class FileManager:
         Returns:
             Selected directory path or None if cancelled
         """
-        self._ensure_tk_root()
-        
-        initial_dir = self._last_directories.get('export', os.getcwd())
-        
-        try:
-            dirname = filedialog.askdirectory(
-                title="Choose Export Directory",
-                initialdir=initial_dir
-            )
-            if dirname:
-                self._last_directories['export'] = dirname
-                return dirname
-        except Exception as e:
-            print(f"Directory dialog error: {e}")
-        
-        return None
+        paths = self._tk_call(self._run_dialog, 'directory', 'export', title="Choose Export Directory")
+        return paths[0] if paths else None
     
     def show_error_dialog(self, title: str, message: str):
         """
@@ -209,9 +234,8 @@ class FileManager:
             title: Dialog title
             message: Error message
         """
-        self._ensure_tk_root()
         try:
-            messagebox.showerror(title, message)
+            self._tk_call(self._messagebox, messagebox.showerror, title, message)
         except Exception as e:
             print(f"Error dialog failed: {e}")
             print(f"Original error - {title}: {message}")
@@ -224,9 +248,8 @@ class FileManager:
             title: Dialog title
             message: Warning message
         """
-        self._ensure_tk_root()
         try:
-            messagebox.showwarning(title, message)
+            self._tk_call(self._messagebox, messagebox.showwarning, title, message)
         except Exception as e:
             print(f"Warning dialog failed: {e}")
             print(f"Original warning - {title}: {message}")
@@ -239,9 +262,8 @@ class FileManager:
             title: Dialog title
             message: Information message
         """
-        self._ensure_tk_root()
         try:
-            messagebox.showinfo(title, message)
+            self._tk_call(self._messagebox, messagebox.showinfo, title, message)
         except Exception as e:
             print(f"Info dialog failed: {e}")
             print(f"Original info - {title}: {message}")
@@ -257,9 +279,8 @@ class FileManager:
         Returns:
             True if user confirmed, False otherwise
         """
-        self._ensure_tk_root()
         try:
-            return messagebox.askyesno(title, message)
+            return self._tk_call(self._messagebox, messagebox.askyesno, title, message)
         except Exception as e:
             print(f"Confirm dialog failed: {e}")
             print(f"Original question - {title}: {message}")
@@ -277,11 +298,29 @@ class FileManager:
         """
         if not filepath:
             return False, "File path is empty"
-        
-        if not os.path.exists(filepath):
+        return self._cached_validation('file', filepath, self._check_file_path)
+    
+    def _cached_validation(self, kind: str, path: str, check) -> Tuple[bool, str]:
+        """Return a recent validation result for path, or run check and store it."""
+        now = time.monotonic()
+        key = (kind, path)
+        entry = self._stat_cache.get(key)
+        if entry is not None and now - entry[0] < _STAT_TTL:
+            return entry[1]
+        result = check(path)
+        if len(self._stat_cache) >= _STAT_CACHE_MAX:
+            self._stat_cache.clear()
+        self._stat_cache[key] = (now, result)
+        return result
+    
+    def _check_file_path(self, filepath: str) -> Tuple[bool, str]:
+        # One stat() instead of separate exists/isfile checks
+        try:
+            st = os.stat(filepath)
+        except (OSError, ValueError):
             return False, f"File does not exist: {filepath}"
         
-        if not os.path.isfile(filepath):
+        if not stat.S_ISREG(st.st_mode):
             return False, f"Path is not a file: {filepath}"
         
         if not os.access(filepath, os.R_OK):
@@ -301,11 +340,15 @@ class FileManager:
         """
         if not dirpath:
             return False, "Directory path is empty"
-        
-        if not os.path.exists(dirpath):
+        return self._cached_validation('dir', dirpath, self._check_directory_path)
+    
+    def _check_directory_path(self, dirpath: str) -> Tuple[bool, str]:
+        try:
+            st = os.stat(dirpath)
+        except (OSError, ValueError):
             return False, f"Directory does not exist: {dirpath}"
         
-        if not os.path.isdir(dirpath):
+        if not stat.S_ISDIR(st.st_mode):
             return False, f"Path is not a directory: {dirpath}"
         
         if not os.access(dirpath, os.R_OK):
@@ -324,7 +367,7 @@ class FileManager:
             File size in bytes, or 0 if error
         """
         try:
-            return os.path.getsize(filepath)
+            return os.stat(filepath).st_size
         except Exception:
             return 0
     
@@ -344,11 +387,20 @@ class FileManager:
         except Exception:
             return filepath
     
+    def _destroy_tk_root(self):
+        with self._tk_lock:
+            if self._tk_root:
+                try:
+                    self._tk_root.destroy()
+                except Exception:
+                    pass
+                self._tk_root = None
+    
     def cleanup(self):
         """Cleanup resources."""
-        if self._tk_root:
-            try:
-                self._tk_root.destroy()
-            except Exception:
-                pass
-            self._tk_root = None
+        with self._tk_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            # The root must be destroyed on the thread that created it
+            executor.submit(self._destroy_tk_root)
+            executor.shutdown(wait=True)